@@ -1 +1,3 @@
-LL_LN_CONVERSION_FACTOR = 1.732
+import math
+
+LL_LN_CONVERSION_FACTOR = math.sqrt(3.0)
@@ -7,6 +7,7 @@ from gdm.distribution.enums import (
     LimitType,
 )
 
+from ditto.constants import LL_LN_CONVERSION_FACTOR
 from ditto.readers.cim_iec_61968_13.cim_mapper import CimMapper
 from ditto.readers.cim_iec_61968_13.common import phase_mapper, normalize_phase_tokens
 
@@ -38,7 +39,7 @@ class DistributionBusMapper(CimMapper):
 
     # Nominal voltage is only defined by transformers
     def map_rated_voltage(self, row):
-        return Voltage(float(row["rated_voltage"]) / 1.732, "volt")
+        return Voltage(float(row["rated_voltage"]) / LL_LN_CONVERSION_FACTOR, "volt")
 
     def map_phases(self, row):
         phases = self._normalize_phase_tokens(row)
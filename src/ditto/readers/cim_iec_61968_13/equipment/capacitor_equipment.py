@@ -4,6 +4,7 @@ from gdm.distribution.equipment.capacitor_equipment import CapacitorEquipment
 from gdm.distribution.enums import ConnectionType, VoltageTypes
 from gdm.quantities import Voltage
 
+from ditto.constants import LL_LN_CONVERSION_FACTOR
 from ditto.readers.cim_iec_61968_13.cim_mapper import CimMapper
 from ditto.readers.cim_iec_61968_13.common import normalize_phase_tokens
 
@@ -37,7 +38,9 @@ class CapacitorEquipmentMapper(CimMapper):
         phase_loads = []
         n_phases = len(self.phases)
         voltage = (
-            float(row["rated_voltage"]) if n_phases == 3 else float(row["rated_voltage"]) / 1.732
+            float(row["rated_voltage"])
+            if n_phases == 3
+            else float(row["rated_voltage"]) / LL_LN_CONVERSION_FACTOR
         )
         b1 = float(row["b1"])
         var = voltage**2 * b1
@@ -4,6 +4,7 @@ from gdm.distribution.equipment import VoltageSourceEquipment, PhaseVoltageSourc
 from gdm.quantities import Resistance, Reactance, Angle, Voltage
 from gdm.distribution.enums import VoltageTypes
 
+from ditto.constants import LL_LN_CONVERSION_FACTOR
 from ditto.readers.cim_iec_61968_13.cim_mapper import CimMapper
 
 
@@ -59,7 +60,7 @@ class PhaseVoltageSourceEquipmentMapper(CimMapper):
         return Reactance(float(row["x1"]), "ohm")
 
     def map_voltage(self, row):
-        return Voltage(float(row["src_voltage"]) / 1.732, "volt")
+        return Voltage(float(row["src_voltage"]) / LL_LN_CONVERSION_FACTOR, "volt")
 
     def map_angle(self, row):
         return Angle(float(row["src_angle"]) * 180 / pi, "degree")
@@ -3,6 +3,7 @@ from gdm.quantities import Voltage, ApparentPower
 from gdm.distribution.equipment import WindingEquipment
 from gdm.distribution.components import DistributionBus
 
+from ditto.constants import LL_LN_CONVERSION_FACTOR
 from ditto.readers.cim_iec_61968_13.cim_mapper import CimMapper
 from ditto.readers.cim_iec_61968_13.common import phase_mapper, normalize_phase_tokens
 
@@ -118,7 +119,7 @@ class WindingEquipmentMapper(CimMapper):
     def map_rated_voltage(self, row, winding_number):
         voltage = float(row[f"wdg_{winding_number}_rated_voltage"])
         if self.n_phases > 1:
-            return Voltage(voltage / 1.732, "volt")
+            return Voltage(voltage / LL_LN_CONVERSION_FACTOR, "volt")
         else:
             return Voltage(voltage, "volt")
 
@@ -3,6 +3,9 @@ from functools import lru_cache
 from rdflib.query import Result
 from loguru import logger
 from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.plugins.stores.memory import Memory, SimpleMemory
 from rdflib.term import BNode, Literal, URIRef
 import pandas as pd
 
@@ -18,6 +21,16 @@ def _prefix_block(namespace_key: tuple[tuple[str, str], ...]) -> str:
     return "".join(f"PREFIX {prefix_name}: <{url}>\n" for prefix_name, url in namespace_key)
 
 
+# Stores evaluated by rdflib's own SPARQL engine; native stores (e.g. Oxigraph) take query text.
+_RDFLIB_SPARQL_STORES = (Memory, SimpleMemory)
+
+
+@lru_cache(maxsize=128)
+def _prepared_query(query: str, namespace_key: tuple[tuple[str, str], ...]) -> Query:
+    # Parsing and algebra translation cost as much as evaluating these queries on small graphs.
+    return prepareQuery(_prefix_block(namespace_key) + query)
+
+
 def _shorten_uri(value: str) -> str:
     token = value.rstrip("/")
     for delimiter in ("#", "/", "."):
@@ -49,7 +62,11 @@ def _normalize_rdf_value(value):
 
 
 def _query_dataframe(graph: Graph, query: str, columns: list[str]) -> pd.DataFrame:
-    return query_to_df(graph.query(add_prefixes(query, graph)), columns)
+    if isinstance(graph.store, _RDFLIB_SPARQL_STORES):
+        results = graph.query(_prepared_query(query, _namespace_key(graph)))
+    else:
+        results = graph.query(add_prefixes(query, graph))
+    return query_to_df(results, columns)
 
 
 def _sorted_phase_string(phase_values: list) -> str | None:
@@ -66,18 +83,29 @@ def _sorted_phase_string(phase_values: list) -> str | None:
     return ",".join(ordered_phases) if ordered_phases else None
 
 
+def _order_by_terminal(data: pd.DataFrame) -> pd.DataFrame:
+    """Order rows so a two-terminal device's first bus comes from its first terminal.
+
+    SPARQL leaves row order unspecified, so ``bus_1``/``bus_2`` are taken after sorting on
+    ``ACDCTerminal.sequenceNumber`` and then terminal name, not in whatever order the store
+    returned the rows.
+    """
+    sequence = pd.to_numeric(data["sequence"], errors="coerce")
+    term_name = data["term_name"].astype(str)
+    order = np.lexsort((term_name.to_numpy(), sequence.fillna(np.inf).to_numpy()))
+    return data.iloc[order]
+
+
 def add_prefixes(query: str, graph: Graph) -> str:
     return _prefix_block(_namespace_key(graph)) + query
 
 
 def query_to_df(results: Result, columns: list[str]):
-    data = []
-    for row in results:
-        row_data = {}
-        for column, value in zip(columns, row):
-            row_data[column] = _normalize_rdf_value(value)
-        data.append(row_data)
-    data = pd.DataFrame(data, columns=columns)
+    # One tuple per row keeps construction columnar instead of building a dict per row.
+    data = pd.DataFrame.from_records(
+        [tuple(_normalize_rdf_value(value) for value in row) for row in results],
+        columns=columns,
+    )
     data = data.drop_duplicates()
 
     return data
@@ -161,7 +189,8 @@ def query_line_codes(graph: Graph) -> pd.DataFrame:
         )
 
     output_rows = []
-    for line_code, line_data in impedance_data.groupby("line_code", dropna=False, sort=False):
+    # Sorted by name so line-code order does not depend on the store's row order.
+    for line_code, line_data in impedance_data.groupby("line_code", dropna=False, sort=True):
         phase_count = int(pd.to_numeric(line_data["phase_count"], errors="coerce").iloc[0])
         ampacities = ampacity_map.get(line_code, [0.0])
         output_rows.append(
@@ -188,10 +217,13 @@ def query_load_break_switches(graph: Graph) -> pd.DataFrame:
         "is_open",
         "voltage",
         "bus",
+        "sequence",
+        "term_name",
     ]
 
     query = """
     SELECT  ?switch_name ?capacity ?ratedCurrent ?normally_open ?is_open ?voltage ?node_name
+            ?sequence ?term_name
     WHERE {
         ?switch rdf:type cim:LoadBreakSwitch  .
         ?switch cim:IdentifiedObject.name ?switch_name .
@@ -204,7 +236,8 @@ def query_load_break_switches(graph: Graph) -> pd.DataFrame:
         ?term cim:Terminal.ConductingEquipment ?switch .
         ?term cim:Terminal.ConnectivityNode ?node .
         ?node cim:IdentifiedObject.name ?node_name .
-
+        OPTIONAL { ?term cim:ACDCTerminal.sequenceNumber ?sequence . }
+        OPTIONAL { ?term cim:IdentifiedObject.name ?term_name . }
     }
     """
     data = _query_dataframe(graph, query, columns)
@@ -222,6 +255,7 @@ def query_load_break_switches(graph: Graph) -> pd.DataFrame:
             ]
         )
     data_set = []
+    data = _order_by_terminal(data)
     for line_name in data["switch_name"].unique():
         filt_data = data[data["switch_name"] == line_name]
         buses = filt_data["bus"].unique()
@@ -246,16 +280,27 @@ def query_load_break_switches(graph: Graph) -> pd.DataFrame:
             ]
         )
     data = pd.concat(data_set)
-    data.drop("bus", axis=1, inplace=True)
+    data.drop(["bus", "sequence", "term_name"], axis=1, inplace=True)
     data = data.drop_duplicates()
     return data
 
 
 def query_line_segments(graph: Graph) -> pd.DataFrame:
-    columns = ["line", "voltage", "length", "bus", "phase_count", "line_code", "phase"]
+    columns = [
+        "line",
+        "voltage",
+        "length",
+        "bus",
+        "phase_count",
+        "line_code",
+        "phase",
+        "sequence",
+        "term_name",
+    ]
 
     query = """
     SELECT  ?line_name ?voltage ?length ?node_name ?phase_count ?line_code ?phase
+            ?sequence ?term_name
     WHERE {
         ?line rdf:type cim:ACLineSegment .
         ?line cim:IdentifiedObject.name ?line_name .
@@ -271,7 +316,8 @@ def query_line_segments(graph: Graph) -> pd.DataFrame:
         ?line cim:ACLineSegment.PerLengthImpedance ?puimp .
         ?puimp cim:PerLengthPhaseImpedance.conductorCount ?phase_count .
         ?puimp cim:IdentifiedObject.name ?line_code .
-
+        OPTIONAL { ?term cim:ACDCTerminal.sequenceNumber ?sequence . }
+        OPTIONAL { ?term cim:IdentifiedObject.name ?term_name . }
     }
     """
     data = _query_dataframe(graph, query, columns)
@@ -290,18 +336,15 @@ def query_line_segments(graph: Graph) -> pd.DataFrame:
             ]
         )
 
+    data = _order_by_terminal(data)
     data_set = []
-    for line_name in data["line"].unique():
-        filt_data = data[data["line"] == line_name]
+    for line_name, filt_data in data.groupby("line", sort=False):
         buses = filt_data["bus"].unique()
         if len(buses) < 2:
+            # Dangling segments are dropped before any per-bus phase work.
             logger.warning(f"Line '{line_name}' has fewer than 2 buses ({len(buses)}), skipping")
             continue
-        bus_phases = {}
-        for bus in buses:
-            filt_data_bus = filt_data[filt_data["bus"] == bus]
-            phases = filt_data_bus["phase"].to_list()
-            bus_phases[bus] = phases
+        bus_phases = filt_data.groupby("bus", sort=False)["phase"].agg(list)
         reduced_data = filt_data[["line", "voltage", "length", "phase_count", "line_code"]]
         reduced_data = reduced_data.drop_duplicates()
         reduced_data["bus_1"] = buses[0]
@@ -536,12 +579,14 @@ def query_distribution_regulators(graph: Graph) -> pd.DataFrame:
         "z_0_leakage",
         "z_1_loadloss",
         "z_0_loadloss",
+        "sequence",
+        "term_name",
     ]
 
     query = """
     SELECT ?xfmr_name ?apparent_power ?rated_voltage ?per_resistance ?conn ?angle ?winding ?node_name
         ?xfmr_end_name ?phases ?max_tap ?min_tap ?neutral_tap ?normal_tap ?dv ?current_tap
-        ?z_1_leakage ?z_0_leakage ?z_1_loadloss ?z_0_loadloss
+        ?z_1_leakage ?z_0_leakage ?z_1_loadloss ?z_0_loadloss ?sequence ?term_name
     WHERE {
         ?xfmr rdf:type cim:TransformerTank .
         ?xfmr cim:TransformerTank.TransformerTankInfo ?xfmr_info .
@@ -562,7 +607,8 @@ def query_distribution_regulators(graph: Graph) -> pd.DataFrame:
         ?term cim:Terminal.ConductingEquipment ?pwr_xfmr .
         ?term cim:Terminal.ConnectivityNode ?node .
         ?node cim:IdentifiedObject.name ?node_name .
-
+        OPTIONAL { ?term cim:ACDCTerminal.sequenceNumber ?sequence . }
+        OPTIONAL { ?term cim:IdentifiedObject.name ?term_name . }
 
         ?xfmr_tank_end rdf:type cim:TransformerTankEnd  .
         ?xfmr_tank_end cim:TransformerTankEnd.TransformerTank ?xfmr .
@@ -593,7 +639,8 @@ def query_distribution_regulators(graph: Graph) -> pd.DataFrame:
     }
 
     """
-    return _query_dataframe(graph, query, columns)
+    data = _order_by_terminal(_query_dataframe(graph, query, columns))
+    return data.drop(columns=["sequence", "term_name"])
 
 
 def query_power_transformers(graph: Graph) -> pd.DataFrame:
@@ -848,16 +895,13 @@ def query_batteries(graph: Graph) -> pd.DataFrame:
     if data.empty or "battery" not in data.columns:
         return _empty_df(columns)
 
-    data_set = []
-    for battery_name in data["battery"].unique():
-        battery_rows = data[data["battery"] == battery_name].copy()
-        first_row = battery_rows.iloc[0].copy()
-
-        first_row["phase"] = _sorted_phase_string(battery_rows["phase"].dropna().tolist())
-
-        data_set.append(first_row)
-
-    return pd.DataFrame(data_set)
+    # One row per battery: the first row's values with its phases merged in A,B,C,N order.
+    phases = data.groupby("battery", sort=False)["phase"].agg(
+        lambda values: _sorted_phase_string(values.dropna().tolist())
+    )
+    data = data.drop_duplicates("battery").copy()
+    data["phase"] = data["battery"].map(phases)
+    return data
 
 
 def query_regulator_controllers(graph: Graph) -> pd.DataFrame:
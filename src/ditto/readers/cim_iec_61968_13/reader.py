@@ -15,6 +15,7 @@ from gdm.distribution.components import (
     DistributionLoad,
     DistributionBus,
 )
+from lxml import etree as ET
 from loguru import logger
 from rdflib import Graph
 import pandas as pd
@@ -37,6 +38,20 @@ from ditto.readers.cim_iec_61968_13.queries import (
 import ditto.readers.cim_iec_61968_13 as cim_mapper
 from ditto.readers.reader import AbstractReader
 
+# oxrdflib's native RDF/XML parser loads straight into the Oxigraph store.
+_RDF_XML_FORMATS = {"Oxigraph": "ox-xml"}
+
+
+def _root_namespaces(cim_file: Path) -> dict[str, str]:
+    """Return the prefixes declared on the document root without parsing the rest of it."""
+    namespaces = {}
+    for event, item in ET.iterparse(str(cim_file), events=("start-ns", "start")):
+        if event == "start":
+            break
+        prefix, uri = item
+        namespaces[prefix] = uri
+    return namespaces
+
 
 class Reader(AbstractReader):
     # NOTE:  Do not change sequnce of the component types below.
@@ -54,13 +69,23 @@ class Reader(AbstractReader):
         MatrixImpedanceSwitch,
     ]
 
-    def __init__(self, cim_file: str | Path):
+    def __init__(self, cim_file: str | Path, store: str = "default"):
+        """Parse ``cim_file`` into an RDF graph.
+
+        ``store`` is the rdflib store plugin backing the graph. ``"Oxigraph"`` (installed with
+        the ``oxigraph`` extra) parses the RDF/XML and evaluates the SPARQL queries natively and
+        is much faster on large models.
+        """
         cim_file = Path(cim_file)
         if not cim_file.exists():
             raise FileNotFoundError(f"{cim_file} does not exist")
         self.system = DistributionSystem(auto_add_composed_components=True)
-        self.graph = Graph()
-        self.graph.parse(cim_file, format="xml")
+        self.graph = Graph(store=store)
+        self.graph.parse(cim_file, format=_RDF_XML_FORMATS.get(store, "xml"))
+        if store in _RDF_XML_FORMATS:
+            # Native parsers do not bind the document prefixes the queries are written against.
+            for prefix, uri in _root_namespaces(cim_file).items():
+                self.graph.bind(prefix, uri)
 
     def read(self):
         datasets: dict[DistributionComponentBase, pd.DataFrame] = {}
@@ -211,7 +236,10 @@ class Reader(AbstractReader):
 
         xfms = []
         for xfmr in xfmr_data["xfmr"].unique():
-            xfmr_df = xfmr_data[xfmr_data["xfmr"] == xfmr].copy()
+            # Order by TransformerEnd.endNumber; SPARQL row order is store-dependent.
+            xfmr_df = xfmr_data[xfmr_data["xfmr"] == xfmr].sort_values(
+                "winding", key=lambda column: pd.to_numeric(column, errors="coerce"), kind="stable"
+            )
             xfmr_df.drop(columns=["xfmr"], inplace=True, errors="ignore")
             windings = xfmr_df["winding"].drop_duplicates().to_list()
             selected_buses, winding_rows = self._select_transformer_winding_rows(xfmr_df, windings)
@@ -7,7 +7,8 @@ from pydantic import ValidationError
 from rich.console import Console
 from infrasys import Component
 from rich.table import Table
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+from itertools import chain, islice
 
 from gdm.distribution.components.distribution_bus import DistributionBus
 from gdm.distribution.components import DistributionVoltageSource
@@ -19,6 +20,8 @@ from ditto.readers.cyme.constants import ModelUnitSystem
 
 
 class Reader(AbstractReader):
+    MAX_REPORTED_VALIDATION_ERRORS = 500
+
     # Order of components is important
     component_types = [
         "DistributionBus",  # First as other components connect to buses
@@ -54,6 +57,7 @@ class Reader(AbstractReader):
         raise_on_validation_error=False,
     ):
         self.validation_errors = []
+        self._prepared_cache = {}
         self.raise_on_validation_error = raise_on_validation_error
         self.system = DistributionSystem(auto_add_composed_components=True)
         self.read(
@@ -85,16 +89,9 @@ class Reader(AbstractReader):
             parse_substation=True,
         )
         section_id_sections = section_data.set_index("SectionID").to_dict(orient="index")
-        from_node_sections = (
-            section_data.groupby("FromNodeID")
-            .apply(lambda df: df.to_dict(orient="records"))
-            .to_dict()
-        )
-        to_node_sections = (
-            section_data.groupby("ToNodeID")
-            .apply(lambda df: df.to_dict(orient="records"))
-            .to_dict()
-        )
+        records = section_data.to_dict(orient="records")
+        from_node_sections = self._group_records(section_data, records, "FromNodeID")
+        to_node_sections = self._group_records(section_data, records, "ToNodeID")
         return (
             section_id_sections,
             from_node_sections,
@@ -103,6 +100,12 @@ class Reader(AbstractReader):
             node_substation_map,
         )
 
+    @staticmethod
+    def _group_records(section_data, records, column):
+        # groupby(...).indices yields positional index arrays without building a frame per group
+        groups = section_data.groupby(column, sort=False).indices
+        return {node: [records[i] for i in positions] for node, positions in groups.items()}
+
     def _get_mapper(self, component_type, unit_system):
         mapper_name = component_type + "Mapper"
         if not hasattr(cyme_mapper, mapper_name):
@@ -189,10 +192,14 @@ class Reader(AbstractReader):
         }
 
     def _flatten_components(self, components):
-        filtered = [c for c in components if c is not None]
-        return [item for c in filtered for item in (c if isinstance(c, list) else [c])]
+        return list(
+            chain.from_iterable(
+                c if isinstance(c, list) else (c,) for c in components if c is not None
+            )
+        )
 
     def _add_components_if_missing(self, components):
+        # Checked per component: adding one can auto-attach others later in the list.
         for comp in components:
             if not self.system.has_component(comp):
                 self.system.add_component(comp)
@@ -315,16 +322,20 @@ class Reader(AbstractReader):
 
     def _validate_model(self):
         if self.validation_errors:
-            error_table = Table(title="Validation warning summary")
+            n_errors = len(self.validation_errors)
+            n_omitted = n_errors - self.MAX_REPORTED_VALIDATION_ERRORS
+            error_table = Table(
+                title="Validation warning summary",
+                caption=f"{n_omitted} more issue(s) not shown" if n_omitted > 0 else None,
+            )
             error_table.add_column("Model", justify="right", style="cyan", no_wrap=True)
             error_table.add_column("Type", style="green")
             error_table.add_column("Field", justify="right", style="bright_magenta")
             error_table.add_column("Error", style="bright_red")
             error_table.add_column("Message", justify="right", style="turquoise2")
 
-            for row in self.validation_errors:
-                print(row)
-                error_table.add_row(*row)
+            for row in islice(self.validation_errors, self.MAX_REPORTED_VALIDATION_ERRORS):
+                error_table.add_row(*map(str, row))
 
             console = Console()
             console.print(error_table)
@@ -333,13 +344,20 @@ class Reader(AbstractReader):
                     "Validations errors occurred when running the script. See the table above"
                 )
             logger.warning(
-                f"Validation warnings detected in CYME reader: {len(self.validation_errors)} issue(s). "
+                f"Validation warnings detected in CYME reader: {n_errors} issue(s). "
                 "Continuing because raise_on_validation_error=False."
             )
 
     def _prepare_data(
         self, cyme_file, cyme_section, load_model_id, network_file, equipment_file, load_file
     ):
+        # Several mappers share a section (e.g. TRANSFORMER, CUSTOMER LOADS); mappers only
+        # read rows, so the parsed frame can be reused across them.
+        key = (cyme_file, cyme_section, load_model_id)
+        cached = self._prepared_cache.get(key)
+        if cached is not None:
+            return cached
+
         if cyme_file == "Network":
             data = read_cyme_data(network_file, cyme_section)
         elif cyme_file == "Equipment":
@@ -358,6 +376,7 @@ class Reader(AbstractReader):
         else:
             raise ValueError(f"Unknown CYME file {cyme_file}")
 
+        self._prepared_cache[key] = data
         return data
 
     def get_system(self) -> DistributionSystem:
@@ -580,32 +599,21 @@ class Reader(AbstractReader):
     def _sort_parallel_components(
         self, comps: list[Component]
     ) -> tuple[list[DistributionTransformer], list[Component]]:
-        name_counts = defaultdict(int)
-        for comp in comps:
-            name_counts[comp.name] += 1
+        name_counts = Counter(comp.name for comp in comps)
 
         seen_names = defaultdict(int)
         renamed_components = []
         for comp in comps:
-            if name_counts[comp.name] > 1:
-                new_name = f"{comp.name}_{seen_names[comp.name]}"
+            name = comp.name
+            if name_counts[name] > 1:
+                seen = seen_names[name]
+                seen_names[name] = seen + 1
                 # Use model_construct to avoid validation before assign_bus_voltages()
                 # At this point buses have placeholder voltages, so pydantic validation would fail
-                values = {}
-                for field in type(comp).model_fields:
-                    cur_val = getattr(comp, field)
-                    if field == "name":
-                        val = new_name
-                    elif field in ("uuid",):
-                        continue
-                    else:
-                        val = cur_val
-                    values[field] = val
-                new_comp = type(comp).model_construct(**values)
+                new_comp = self._clone_with_new_name(comp, f"{name}_{seen}")
                 self.system.add_component(new_comp)
                 self.system.remove_component(comp)
                 renamed_components.append(new_comp)
-                seen_names[comp.name] += 1
             else:
                 renamed_components.append(comp)
 
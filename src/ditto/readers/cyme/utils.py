@@ -1,5 +1,9 @@
 from loguru import logger
 
+import locale
+import mmap
+import os
+import re
 import pandas as pd
 from gdm.distribution.components.distribution_feeder import DistributionFeeder
 from gdm.distribution.components.distribution_substation import DistributionSubstation
@@ -7,7 +11,52 @@ from gdm.distribution.distribution_system import DistributionSystem
 from gdm.distribution.components.distribution_bus import DistributionBus
 from infrasys.exceptions import ISAlreadyAttached
 
-from functools import partial
+from functools import lru_cache, partial
+
+_SECTION_HEADER = re.compile(rb"^\[([^\]\r\n]+)\][^\n]*$", re.MULTILINE)
+_BLANK_LINE = re.compile(rb"^[ \t\r\f\v]*$", re.MULTILINE)
+
+
+def section_offsets(cyme_file) -> dict[str, tuple[int, int]]:
+    """Return the ``(start, end)`` byte offsets of every ``[SECTION]`` body in a CYME file.
+
+    The file is scanned once and the index is cached per path, keyed on the file's
+    modification time and size so that edited files are re-indexed.
+    """
+    stat = os.stat(cyme_file)
+    return _index_sections(os.fspath(cyme_file), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _index_sections(cyme_file, mtime_ns, size):
+    offsets = {}
+    if size == 0:
+        return offsets
+    with open(cyme_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for match in _SECTION_HEADER.finditer(mm):
+            name = match.group(1).decode(_file_encoding())
+            if name in offsets:
+                continue
+            start = min(match.end() + 1, size)
+            blank = _BLANK_LINE.search(mm, start)
+            end = blank.start() if blank is not None else size
+            offsets[name] = (start, end)
+    return offsets
+
+
+def _file_encoding():
+    # Same encoding a text-mode open() without an explicit encoding would use.
+    return locale.getpreferredencoding(False)
+
+
+def _read_section_lines(cyme_file, cyme_section):
+    offsets = section_offsets(cyme_file).get(cyme_section)
+    if offsets is None:
+        return []
+    start, end = offsets
+    with open(cyme_file, "rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode(_file_encoding()).splitlines()
 
 
 def read_cyme_data(  # noqa: C901
@@ -21,49 +70,38 @@ def read_cyme_data(  # noqa: C901
 ):
     all_data = []
     headers = None
-    with open(cyme_file) as f:
-        reading = False
-        feeder_id = None
-        feeder_object_map = {}
-        substation_id = None
-        substation_object_map = {}
-
-        for line in f:
-            if line.startswith(f"[{cyme_section}]"):
-                reading = True
-                continue
-            if not reading:
-                continue
-            if line.strip() == "":
-                break
-
-            if line.startswith(f"FORMAT_{cyme_section.replace(' ', '')}"):
-                headers = line.split("=")[1].strip().split(",")
-                continue
-            elif line.startswith(("FORMAT", "FEEDER", "SUBSTATION")):
-                feeder_id, substation_id = _parse_context_line(
-                    line, parse_feeders, parse_substation
-                )
-                continue
-            else:
-                try:
-                    line = line.strip()
-                    line_data = line.split(",")
-                    if cyme_section == "SECTION":
-                        _track_section_nodes(
-                            line_data,
-                            feeder_id,
-                            substation_id,
-                            parse_feeders,
-                            parse_substation,
-                            node_feeder_map,
-                            feeder_object_map,
-                            node_substation_map,
-                            substation_object_map,
-                        )
-                    all_data.append(line_data)
-                except Exception as e:
-                    raise Exception(f"Failed to parse line: {line}. Error: {e}")
+    feeder_id = None
+    feeder_object_map = {}
+    substation_id = None
+    substation_object_map = {}
+    format_prefix = f"FORMAT_{cyme_section.replace(' ', '')}"
+
+    for line in _read_section_lines(cyme_file, cyme_section):
+        if line.startswith(format_prefix):
+            headers = line.split("=")[1].strip().split(",")
+            continue
+        elif line.startswith(("FORMAT", "FEEDER", "SUBSTATION")):
+            feeder_id, substation_id = _parse_context_line(line, parse_feeders, parse_substation)
+            continue
+        else:
+            try:
+                line = line.strip()
+                line_data = line.split(",")
+                if cyme_section == "SECTION":
+                    _track_section_nodes(
+                        line_data,
+                        feeder_id,
+                        substation_id,
+                        parse_feeders,
+                        parse_substation,
+                        node_feeder_map,
+                        feeder_object_map,
+                        node_substation_map,
+                        substation_object_map,
+                    )
+                all_data.append(line_data)
+            except Exception as e:
+                raise Exception(f"Failed to parse line: {line}. Error: {e}")
 
     data = pd.DataFrame(all_data, columns=headers)
 
@@ -13,6 +13,7 @@ import opendssdirect as odd
 from infrasys import System
 from loguru import logger
 
+from ditto.constants import LL_LN_CONVERSION_FACTOR
 from ditto.readers.opendss.common import PHASE_MAPPER, get_equipment_from_catalog
 from ditto.readers.opendss.components.loadshapes import build_profiles, ObjectsWithProfile
 
@@ -59,7 +60,7 @@ def _build_voltage_source_equipment(
             x0=Reactance(phase_src_properties["x0"], "ohm"),
             x1=Reactance(phase_src_properties["x1"], "ohm"),
             angle=angle,
-            voltage=voltage / 1.732 if num_phase == 3 else voltage,
+            voltage=voltage / LL_LN_CONVERSION_FACTOR if num_phase == 3 else voltage,
             voltage_type=VoltageTypes.LINE_TO_GROUND,
         )
         phase_slack = get_equipment_from_catalog(
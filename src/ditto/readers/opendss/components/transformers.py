@@ -23,6 +23,7 @@ from infrasys.system import System
 import opendssdirect as odd
 from loguru import logger
 
+from ditto.constants import LL_LN_CONVERSION_FACTOR
 from ditto.readers.opendss.common import PHASE_MAPPER, get_equipment_from_catalog
 
 SEQUENCE_PAIRS = [SequencePair(1, 2), SequencePair(1, 3), SequencePair(2, 3)]
@@ -92,9 +93,13 @@ def _build_xfmr_equipment(
         set_ppty("Wdg", wdg_index + 1)
         num_phase = query("phases", int)
         if query("conn", str).lower() == "delta":
-            rated_voltage = query("kv", float) / 1.732
+            rated_voltage = query("kv", float) / LL_LN_CONVERSION_FACTOR
         else:
-            rated_voltage = query("kv", float) / 1.732 if num_phase == 3 else query("kv", float)
+            rated_voltage = (
+                query("kv", float) / LL_LN_CONVERSION_FACTOR
+                if num_phase == 3
+                else query("kv", float)
+            )
         wdg_nom_voltages.append(rated_voltage)
         min_tap_pu = query("mintap", float)
         max_tap_pu = query("maxtap", float)
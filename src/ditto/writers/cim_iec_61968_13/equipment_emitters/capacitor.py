@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+from gdm.distribution.enums import ConnectionType
+
+if TYPE_CHECKING:
+    from lxml import etree as ET
+
+# ShuntCompensator.phaseConnection per GDM connection type.
+_CONNECTION_CODES = {
+    connection.value: "D" if "DELTA" in connection.value else "Y" for connection in ConnectionType
+}
 
 
 def emit_capacitor(
@@ -11,9 +21,7 @@ def emit_capacitor(
     bus_location_ids: dict[str, str],
     base_voltage_cache: dict[str, str],
 ) -> None:
-    bus = getattr(capacitor, "bus", None)
-    if bus is None or bus.name not in bus_node_ids:
-        return
+    bus = capacitor.bus
 
     capacitor_id = writer._deterministic_id("linear_shunt_compensator", capacitor.name)
     capacitor_element = writer._create_identified_object(
@@ -32,38 +40,43 @@ def emit_capacitor(
     writer._add_ref(capacitor_element, "PowerSystemResource.Location", bus_location_ids[bus.name])
 
     conn_text = writer._safe_text(getattr(capacitor.equipment, "connection_type", "STAR"))
-    conn_code = "D" if "DELTA" in conn_text else "Y"
+    conn_code = _CONNECTION_CODES.get(conn_text, "Y")
     writer._add_literal(capacitor_element, "ShuntCompensator.phaseConnection", conn_code)
 
-    phase_caps = list(getattr(capacitor.equipment, "phase_capacitors", []))
+    phase_caps = getattr(capacitor.equipment, "phase_capacitors", None) or ()
     total_var = 0.0
     for phase_cap in phase_caps:
-        total_var += writer._quantity(getattr(phase_cap, "rated_reactive_power", 0.0), "var")
+        reactive_power = phase_cap.rated_reactive_power
+        total_var += reactive_power.magnitude * writer._unit_factor(reactive_power.units, "var")
     b1 = total_var / (rated_voltage**2) if rated_voltage > 0 else 0.0
 
     steps = 1
     if phase_caps:
         steps = int(getattr(phase_caps[0], "num_banks", 1) or 1)
 
-    writer._add_literal(capacitor_element, "LinearShuntCompensator.bPerSection", b1)
-    writer._add_literal(capacitor_element, "LinearShuntCompensator.gPerSection", 0.0)
-    writer._add_literal(capacitor_element, "LinearShuntCompensator.b0PerSection", 0.0)
-    writer._add_literal(capacitor_element, "LinearShuntCompensator.g0PerSection", 0.0)
-    writer._add_literal(capacitor_element, "ShuntCompensator.sections", steps)
+    writer._add_literals(
+        capacitor_element,
+        (
+            ("LinearShuntCompensator.bPerSection", b1),
+            ("LinearShuntCompensator.gPerSection", 0.0),
+            ("LinearShuntCompensator.b0PerSection", 0.0),
+            ("LinearShuntCompensator.g0PerSection", 0.0),
+            ("ShuntCompensator.sections", steps),
+        ),
+    )
 
-    for index, phase in enumerate(getattr(capacitor, "phases", []), start=1):
-        phase_id = writer._deterministic_id(
-            "linear_shunt_compensator_phase", f"{capacitor.name}:{index}"
-        )
-        phase_element = writer._create_identified_object(
+    phases = getattr(capacitor, "phases", None)
+    if phases:
+        writer._emit_phases(
             root,
             "LinearShuntCompensatorPhase",
-            phase_id,
-            f"{capacitor.name}_phase_{index}",
-        )
-        writer._add_ref(phase_element, "ShuntCompensatorPhase.ShuntCompensator", capacitor_id)
-        writer._add_literal(
-            phase_element, "ShuntCompensatorPhase.phase", writer._phase_text(phase)
+            "linear_shunt_compensator_phase",
+            capacitor.name,
+            capacitor.name,
+            phases,
+            "ShuntCompensatorPhase.ShuntCompensator",
+            capacitor_id,
+            "ShuntCompensatorPhase.phase",
         )
 
     writer._create_terminal(root, capacitor_id, bus_node_ids[bus.name], f"{capacitor.name}:1")
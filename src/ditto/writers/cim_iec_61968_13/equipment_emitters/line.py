@@ -1,7 +1,40 @@
 from __future__ import annotations
 
 import math
-import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from lxml import etree as ET
+
+# Shunt capacitance to susceptance at the 60 Hz system frequency.
+_TWO_PI_SIXTY = 2 * math.pi * 60
+
+
+def _line_code_values(r_matrix, x_matrix, c_matrix) -> tuple[list, list, list, list, list]:
+    """Return 1-based rows/cols and r, x, b values of the lower triangle in row-major order.
+
+    The three matrices are stacked and gathered with a single fancy index so all numeric work
+    happens in one NumPy pass per line code; the caller only builds XML.
+    """
+    conductor_count = int(r_matrix.shape[0])
+    rows, cols = np.tril_indices(conductor_count)
+    stacked = np.stack(
+        (
+            np.asarray(r_matrix, dtype=float),
+            np.asarray(x_matrix, dtype=float),
+            np.asarray(c_matrix, dtype=float),
+        )
+    )
+    r_values, x_values, c_values = stacked[:, rows, cols]
+    return (
+        (rows + 1).tolist(),
+        (cols + 1).tolist(),
+        r_values.tolist(),
+        x_values.tolist(),
+        (c_values * _TWO_PI_SIXTY).tolist(),
+    )
 
 
 def emit_line_code_equipment(
@@ -20,30 +53,35 @@ def emit_line_code_equipment(
     )
 
     r_matrix = branch_equipment.r_matrix.magnitude
-    x_matrix = branch_equipment.x_matrix.magnitude
-    c_matrix = branch_equipment.c_matrix.magnitude
     conductor_count = int(r_matrix.shape[0])
     writer._add_literal(line_code, "PerLengthPhaseImpedance.conductorCount", conductor_count)
 
-    for row in range(conductor_count):
-        for col in range(row + 1):
-            phase_data_id = writer._deterministic_id(
-                "phase_impedance_data",
-                f"{branch_equipment.name}:{row + 1}:{col + 1}",
-            )
-            phase_data = writer._create_identified_object(
-                root,
-                "PhaseImpedanceData",
-                phase_data_id,
-                f"{branch_equipment.name}_{row + 1}_{col + 1}",
-            )
-            writer._add_ref(phase_data, "PhaseImpedanceData.PhaseImpedance", line_code_id)
-            writer._add_literal(phase_data, "PhaseImpedanceData.r", float(r_matrix[row, col]))
-            writer._add_literal(phase_data, "PhaseImpedanceData.x", float(x_matrix[row, col]))
-            susceptance = float(c_matrix[row, col]) * 2 * math.pi * 60
-            writer._add_literal(phase_data, "PhaseImpedanceData.b", susceptance)
-            writer._add_literal(phase_data, "PhaseImpedanceData.row", row + 1)
-            writer._add_literal(phase_data, "PhaseImpedanceData.column", col + 1)
+    for row, col, r_value, x_value, susceptance in zip(
+        *_line_code_values(
+            r_matrix, branch_equipment.x_matrix.magnitude, branch_equipment.c_matrix.magnitude
+        )
+    ):
+        phase_data_id = writer._deterministic_id(
+            "phase_impedance_data",
+            f"{branch_equipment.name}:{row}:{col}",
+        )
+        phase_data = writer._create_identified_object(
+            root,
+            "PhaseImpedanceData",
+            phase_data_id,
+            f"{branch_equipment.name}_{row}_{col}",
+        )
+        writer._add_ref(phase_data, "PhaseImpedanceData.PhaseImpedance", line_code_id)
+        writer._add_literals(
+            phase_data,
+            (
+                ("PhaseImpedanceData.r", r_value),
+                ("PhaseImpedanceData.x", x_value),
+                ("PhaseImpedanceData.b", susceptance),
+                ("PhaseImpedanceData.row", row),
+                ("PhaseImpedanceData.column", col),
+            ),
+        )
 
     return line_code_id
 
@@ -57,16 +95,13 @@ def emit_line_segment(
     base_voltage_cache: dict[str, str],
     emitted_line_code_ids: set[str],
 ) -> None:
-    if not getattr(branch, "buses", None) or len(branch.buses) < 2:
-        return
     if not getattr(branch, "equipment", None):
         return
 
     line_id = writer._deterministic_id("line_segment", branch.name)
     line = writer._create_identified_object(root, "ACLineSegment", line_id, branch.name)
 
-    nominal_voltage = writer._bus_nominal_voltage(branch.buses[0])
-    base_voltage_id = writer._create_base_voltage(root, nominal_voltage, base_voltage_cache)
+    base_voltage_id = writer._bus_base_voltage_id(root, branch.buses[0], base_voltage_cache)
     writer._add_ref(line, "ConductingEquipment.BaseVoltage", base_voltage_id)
     writer._add_ref(line, "PowerSystemResource.Location", bus_location_ids[branch.buses[0].name])
     writer._add_literal(line, "Conductor.length", writer._quantity(branch.length, "meter"))
@@ -74,16 +109,19 @@ def emit_line_segment(
     line_code_id = emit_line_code_equipment(writer, root, branch.equipment, emitted_line_code_ids)
     writer._add_ref(line, "ACLineSegment.PerLengthImpedance", line_code_id)
 
-    for index, phase in enumerate(getattr(branch, "phases", []), start=1):
-        phase_id = writer._deterministic_id("line_segment_phase", f"{branch.name}:{index}")
-        line_phase = writer._create_identified_object(
+    phases = getattr(branch, "phases", None)
+    if phases:
+        writer._emit_phases(
             root,
             "ACLineSegmentPhase",
-            phase_id,
-            f"{branch.name}_phase_{index}",
+            "line_segment_phase",
+            branch.name,
+            branch.name,
+            phases,
+            "ACLineSegmentPhase.ACLineSegment",
+            line_id,
+            "ACLineSegmentPhase.phase",
         )
-        writer._add_ref(line_phase, "ACLineSegmentPhase.ACLineSegment", line_id)
-        writer._add_literal(line_phase, "ACLineSegmentPhase.phase", writer._phase_text(phase))
 
     ampacity = writer._quantity(getattr(branch.equipment, "ampacity", 0.0), "ampere")
     writer._create_terminal(
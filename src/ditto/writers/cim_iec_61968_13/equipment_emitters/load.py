@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+from gdm.distribution.enums import ConnectionType
+
+if TYPE_CHECKING:
+    from lxml import etree as ET
+
+# (EnergyConsumer.phaseConnection, EnergyConsumer.grounded) per GDM connection type.
+_CONNECTION_CODES = {
+    connection.value: ("D", "false") if "DELTA" in connection.value else ("Y", "true")
+    for connection in ConnectionType
+}
 
 
 def emit_energy_consumer(
@@ -12,11 +23,14 @@ def emit_energy_consumer(
     base_voltage_cache: dict[str, str],
 ) -> None:
     bus = load.bus
-    load_id = writer._deterministic_id("energy_consumer", load.name)
-    load_element = writer._create_identified_object(root, "EnergyConsumer", load_id, load.name)
+    name = load.name
+    equipment = load.equipment
+    quantity = writer._quantity
 
-    nominal_voltage = writer._bus_nominal_voltage(bus)
-    base_voltage_id = writer._create_base_voltage(root, nominal_voltage, base_voltage_cache)
+    load_id = writer._deterministic_id("energy_consumer", name)
+    load_element = writer._create_identified_object(root, "EnergyConsumer", load_id, name)
+
+    base_voltage_id = writer._bus_base_voltage_id(root, bus, base_voltage_cache)
     writer._add_ref(load_element, "ConductingEquipment.BaseVoltage", base_voltage_id)
     writer._add_ref(load_element, "PowerSystemResource.Location", bus_location_ids[bus.name])
 
@@ -28,11 +42,11 @@ def emit_energy_consumer(
     z_q = 0.0
     i_q = 0.0
     p_q = 0.0
-    phase_loads = getattr(load.equipment, "phase_loads", [])
+    phase_loads = getattr(equipment, "phase_loads", [])
     if phase_loads:
         for phase_load in phase_loads:
-            total_p += writer._quantity(getattr(phase_load, "real_power", 0.0), "watt")
-            total_q += writer._quantity(getattr(phase_load, "reactive_power", 0.0), "var")
+            total_p += quantity(phase_load.real_power, "watt")
+            total_q += quantity(phase_load.reactive_power, "var")
         lead = phase_loads[0]
         z_p = float(getattr(lead, "z_real", 0.0)) * 100.0
         i_p = float(getattr(lead, "i_real", 0.0)) * 100.0
@@ -41,41 +55,53 @@ def emit_energy_consumer(
         i_q = float(getattr(lead, "i_imag", 0.0)) * 100.0
         p_q = float(getattr(lead, "p_imag", 0.0)) * 100.0
 
-    conn_type = writer._safe_text(getattr(load.equipment, "connection_type", "STAR"))
-    conn_code = "D" if "DELTA" in conn_type else "Y"
-    grounded = "false" if conn_code == "D" else "true"
+    conn_type = writer._safe_text(getattr(equipment, "connection_type", "STAR"))
+    conn_code, grounded = _CONNECTION_CODES.get(conn_type, ("Y", "true"))
 
-    writer._add_literal(load_element, "EnergyConsumer.p", total_p)
-    writer._add_literal(load_element, "EnergyConsumer.q", total_q)
-    writer._add_literal(load_element, "EnergyConsumer.phaseConnection", conn_code)
-    writer._add_literal(load_element, "EnergyConsumer.grounded", grounded)
+    writer._add_literals(
+        load_element,
+        (
+            ("EnergyConsumer.p", total_p),
+            ("EnergyConsumer.q", total_q),
+            ("EnergyConsumer.phaseConnection", conn_code),
+            ("EnergyConsumer.grounded", grounded),
+        ),
+    )
 
-    zip_id = writer._deterministic_id("load_response", load.name)
+    zip_id = writer._deterministic_id("load_response", name)
     zip_element = writer._create_identified_object(
         root,
         "LoadResponseCharacteristic",
         zip_id,
-        f"ZIP_{load.name}",
+        f"ZIP_{name}",
+    )
+    writer._add_literals(
+        zip_element,
+        (
+            ("LoadResponseCharacteristic.pConstantImpedance", z_p),
+            ("LoadResponseCharacteristic.pConstantCurrent", i_p),
+            ("LoadResponseCharacteristic.pConstantPower", p_p),
+            ("LoadResponseCharacteristic.qConstantImpedance", z_q),
+            ("LoadResponseCharacteristic.qConstantCurrent", i_q),
+            ("LoadResponseCharacteristic.qConstantPower", p_q),
+            ("LoadResponseCharacteristic.pVoltageExponent", 1.0),
+            ("LoadResponseCharacteristic.qVoltageExponent", 2.0),
+        ),
     )
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.pConstantImpedance", z_p)
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.pConstantCurrent", i_p)
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.pConstantPower", p_p)
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.qConstantImpedance", z_q)
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.qConstantCurrent", i_q)
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.qConstantPower", p_q)
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.pVoltageExponent", 1.0)
-    writer._add_literal(zip_element, "LoadResponseCharacteristic.qVoltageExponent", 2.0)
     writer._add_ref(load_element, "EnergyConsumer.LoadResponse", zip_id)
 
-    for index, phase in enumerate(getattr(load, "phases", []), start=1):
-        phase_id = writer._deterministic_id("energy_consumer_phase", f"{load.name}:{index}")
-        phase_element = writer._create_identified_object(
+    phases = getattr(load, "phases", None)
+    if phases:
+        writer._emit_phases(
             root,
             "EnergyConsumerPhase",
-            phase_id,
-            f"{load.name}_phase_{index}",
+            "energy_consumer_phase",
+            name,
+            name,
+            phases,
+            "EnergyConsumerPhase.EnergyConsumer",
+            load_id,
+            "EnergyConsumerPhase.phase",
         )
-        writer._add_ref(phase_element, "EnergyConsumerPhase.EnergyConsumer", load_id)
-        writer._add_literal(phase_element, "EnergyConsumerPhase.phase", writer._phase_text(phase))
 
-    writer._create_terminal(root, load_id, bus_node_ids[bus.name], f"{load.name}:1")
+    writer._create_terminal(root, load_id, bus_node_ids[bus.name], f"{name}:1")
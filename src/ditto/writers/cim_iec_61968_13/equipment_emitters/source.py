@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 import math
-import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+from ditto.constants import LL_LN_CONVERSION_FACTOR
+
+if TYPE_CHECKING:
+    from lxml import etree as ET
+
+_DEG_TO_RAD = math.pi / 180.0
 
 
 def emit_energy_source(
@@ -17,7 +24,7 @@ def emit_energy_source(
     source_element = writer._create_identified_object(root, "EnergySource", source_id, source.name)
 
     nominal_voltage = writer._bus_nominal_voltage(bus)
-    base_voltage_id = writer._create_base_voltage(root, nominal_voltage, base_voltage_cache)
+    base_voltage_id = writer._bus_base_voltage_id(root, bus, base_voltage_cache)
     writer._add_ref(source_element, "ConductingEquipment.BaseVoltage", base_voltage_id)
     writer._add_ref(source_element, "PowerSystemResource.Location", bus_location_ids[bus.name])
 
@@ -29,12 +36,17 @@ def emit_energy_source(
     phase_voltage = writer._quantity(getattr(source_phase, "voltage", 0.0), "volt")
     angle_deg = writer._quantity(getattr(source_phase, "angle", 0.0), "degree")
 
-    writer._add_literal(source_element, "EnergySource.nominalVoltage", nominal_voltage)
-    writer._add_literal(source_element, "EnergySource.voltageMagnitude", phase_voltage * 1.732)
-    writer._add_literal(source_element, "EnergySource.voltageAngle", angle_deg * math.pi / 180.0)
-    writer._add_literal(source_element, "EnergySource.r", r1)
-    writer._add_literal(source_element, "EnergySource.x", x1)
-    writer._add_literal(source_element, "EnergySource.r0", r0)
-    writer._add_literal(source_element, "EnergySource.x0", x0)
+    writer._add_literals(
+        source_element,
+        (
+            ("EnergySource.nominalVoltage", nominal_voltage),
+            ("EnergySource.voltageMagnitude", phase_voltage * LL_LN_CONVERSION_FACTOR),
+            ("EnergySource.voltageAngle", angle_deg * _DEG_TO_RAD),
+            ("EnergySource.r", r1),
+            ("EnergySource.x", x1),
+            ("EnergySource.r0", r0),
+            ("EnergySource.x0", x0),
+        ),
+    )
 
     writer._create_terminal(root, source_id, bus_node_ids[bus.name], f"{source.name}:1")
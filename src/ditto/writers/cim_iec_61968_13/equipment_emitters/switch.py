@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lxml import etree as ET
 
 
 def emit_switch(
@@ -11,11 +14,7 @@ def emit_switch(
     bus_location_ids: dict[str, str],
     base_voltage_cache: dict[str, str],
 ) -> None:
-    buses = list(getattr(switch, "buses", []))
-    if len(buses) < 2:
-        return
-    if buses[0].name not in bus_node_ids or buses[1].name not in bus_node_ids:
-        return
+    buses = switch.buses
 
     switch_id = writer._deterministic_id("load_break_switch", switch.name)
     switch_element = writer._create_identified_object(
@@ -23,20 +22,20 @@ def emit_switch(
     )
 
     rated_current = writer._quantity(getattr(switch.equipment, "ampacity", 0.0), "ampere")
-    writer._add_literal(switch_element, "ProtectedSwitch.breakingCapacity", rated_current)
-    writer._add_literal(switch_element, "Switch.ratedCurrent", rated_current)
-
-    states = list(getattr(switch, "is_closed", []))
-    is_open = not all(states) if states else False
+    # all() stops at the first open phase and is True for no phases, i.e. closed.
+    is_open = not all(getattr(switch, "is_closed", ()))
     state_text = "true" if is_open else "false"
-    writer._add_literal(switch_element, "Switch.normalOpen", state_text)
-    writer._add_literal(switch_element, "Switch.open", state_text)
-
-    base_voltage_id = writer._create_base_voltage(
-        root,
-        writer._bus_nominal_voltage(buses[0]),
-        base_voltage_cache,
+    writer._add_literals(
+        switch_element,
+        (
+            ("ProtectedSwitch.breakingCapacity", rated_current),
+            ("Switch.ratedCurrent", rated_current),
+            ("Switch.normalOpen", state_text),
+            ("Switch.open", state_text),
+        ),
     )
+
+    base_voltage_id = writer._bus_base_voltage_id(root, buses[0], base_voltage_cache)
     writer._add_ref(switch_element, "ConductingEquipment.BaseVoltage", base_voltage_id)
     writer._add_ref(
         switch_element, "PowerSystemResource.Location", bus_location_ids[buses[0].name]
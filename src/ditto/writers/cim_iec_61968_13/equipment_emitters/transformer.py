@@ -1,6 +1,28 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lxml import etree as ET
+
+# Per-winding literal properties, in emission order: ratedS, ratedU, r, connectionKind,
+# phaseAngleClock, endNumber.
+_END_PROPERTIES = (
+    "PowerTransformerEnd.ratedS",
+    "PowerTransformerEnd.ratedU",
+    "PowerTransformerEnd.r",
+    "PowerTransformerEnd.connectionKind",
+    "PowerTransformerEnd.phaseAngleClock",
+    "TransformerEnd.endNumber",
+)
+_END_INFO_PROPERTIES = (
+    "TransformerEndInfo.ratedS",
+    "TransformerEndInfo.ratedU",
+    "TransformerEndInfo.r",
+    "TransformerEndInfo.connectionKind",
+    "TransformerEndInfo.phaseAngleClock",
+    "TransformerEndInfo.endNumber",
+)
 
 
 def emit_transformer_mesh_impedance(
@@ -11,6 +33,7 @@ def emit_transformer_mesh_impedance(
     end_2_id: str,
     winding_1,
     winding_reactances: list,
+    r1: float | None = None,
 ) -> None:
     mesh_id = writer._deterministic_id("transformer_mesh_impedance", xfmr_name)
     mesh = writer._create_identified_object(
@@ -22,14 +45,95 @@ def emit_transformer_mesh_impedance(
     per_x = winding_reactances[0] if winding_reactances else 1.0
     x1 = writer._winding_reactance_ohm(winding_1, per_x)
     x0 = x1
-    r1 = writer._winding_resistance_ohm(winding_1)
+    if r1 is None:
+        r1 = writer._winding_resistance_ohm(winding_1)
     r0 = r1
-    writer._add_literal(mesh, "TransformerMeshImpedance.r", r1)
-    writer._add_literal(mesh, "TransformerMeshImpedance.x", x1)
-    writer._add_literal(mesh, "TransformerMeshImpedance.r0", r0)
-    writer._add_literal(mesh, "TransformerMeshImpedance.x0", x0)
-    writer._add_ref(mesh, "TransformerMeshImpedance.FromTransformerEnd", end_1_id)
-    writer._add_ref(mesh, "TransformerMeshImpedance.ToTransformerEnd", end_2_id)
+    writer._add_literals(
+        mesh,
+        (
+            ("TransformerMeshImpedance.r", r1),
+            ("TransformerMeshImpedance.x", x1),
+            ("TransformerMeshImpedance.r0", r0),
+            ("TransformerMeshImpedance.x0", x0),
+        ),
+    )
+    writer._add_refs(
+        mesh,
+        (
+            ("TransformerMeshImpedance.FromTransformerEnd", end_1_id),
+            ("TransformerMeshImpedance.ToTransformerEnd", end_2_id),
+        ),
+    )
+
+
+def _emit_winding_end(
+    writer,
+    root: ET.Element,
+    class_name: str,
+    end_id: str,
+    name: str,
+    parent_ref: tuple[str, str],
+    properties: tuple[str, ...],
+    index: int,
+    winding,
+    rated_u: float,
+    resistance: float,
+    connection_kind: str,
+) -> ET.Element:
+    """Emit an end-like element with its parent reference and the six winding properties."""
+    end = writer._create_identified_object(root, class_name, end_id, name)
+    writer._add_ref(end, *parent_ref)
+    rated_s = writer._quantity(winding.rated_power, "VA")
+    writer._add_literals(
+        end,
+        zip(properties, (rated_s, rated_u, resistance, connection_kind, index - 1, index)),
+    )
+    return end
+
+
+def _emit_power_transformer_end(
+    writer,
+    root: ET.Element,
+    xfmr_name: str,
+    power_id: str,
+    index: int,
+    winding,
+    connection_kind: str,
+    node_id: str,
+    base_voltage_cache: dict[str, str],
+) -> tuple[str, str, str, float]:
+    """Emit one PowerTransformerEnd; return its end, tank-end, terminal ids and resistance."""
+    rated_u = writer._line_to_line_winding_voltage(winding)
+    resistance = writer._winding_resistance_ohm(winding)
+    end_key = f"{xfmr_name}:{index}"
+    end_id = writer._deterministic_id("power_transformer_end", end_key)
+    end = _emit_winding_end(
+        writer,
+        root,
+        "PowerTransformerEnd",
+        end_id,
+        f"{xfmr_name}_end_{index}",
+        ("PowerTransformerEnd.PowerTransformer", power_id),
+        _END_PROPERTIES,
+        index,
+        winding,
+        rated_u,
+        resistance,
+        connection_kind,
+    )
+
+    terminal_id = writer._create_terminal(root, power_id, node_id, f"{xfmr_name}:terminal:{index}")
+    winding_base_voltage_id = writer._create_base_voltage(root, rated_u, base_voltage_cache)
+    writer._add_refs(
+        end,
+        (
+            ("TransformerEnd.Terminal", terminal_id),
+            ("TransformerEnd.BaseVoltage", winding_base_voltage_id),
+        ),
+    )
+
+    tank_end_id = writer._deterministic_id("transformer_tank_end", end_key)
+    return end_id, tank_end_id, terminal_id, resistance
 
 
 def emit_power_transformer(
@@ -46,76 +150,66 @@ def emit_power_transformer(
     power_id = writer._deterministic_id("power_transformer", xfmr_name)
     power = writer._create_identified_object(root, "PowerTransformer", power_id, xfmr_name)
 
-    if buses:
-        writer._add_ref(power, "PowerSystemResource.Location", bus_location_ids[buses[0].name])
-        nominal_voltage = writer._bus_nominal_voltage(buses[0])
-        base_voltage_id = writer._create_base_voltage(root, nominal_voltage, base_voltage_cache)
-        writer._add_ref(power, "ConductingEquipment.BaseVoltage", base_voltage_id)
+    # Callers pass components the driver already filtered to two emitted buses.
+    bus_1, bus_2 = buses[0], buses[1]
+    base_voltage_id = writer._bus_base_voltage_id(root, bus_1, base_voltage_cache)
+    writer._add_refs(
+        power,
+        (
+            ("PowerSystemResource.Location", bus_location_ids[bus_1.name]),
+            ("ConductingEquipment.BaseVoltage", base_voltage_id),
+        ),
+    )
 
-    windings = list(getattr(equipment, "windings", []))
+    windings = equipment.windings
     if len(windings) < 2:
         return power_id, [], [], []
 
-    vector_group = "".join(writer._connection_kind(winding) for winding in windings[:2])
-    writer._add_literal(power, "PowerTransformer.vectorGroup", vector_group)
-
-    end_ids: list[str] = []
-    tank_end_ids: list[str] = []
-    terminal_ids: list[str] = []
-
-    for index, (winding, bus) in enumerate(zip(windings[:2], buses[:2]), start=1):
-        end_id = writer._deterministic_id("power_transformer_end", f"{xfmr_name}:{index}")
-        end_ids.append(end_id)
-        end = writer._create_identified_object(
-            root,
-            "PowerTransformerEnd",
-            end_id,
-            f"{xfmr_name}_end_{index}",
-        )
-        writer._add_ref(end, "PowerTransformerEnd.PowerTransformer", power_id)
-        writer._add_literal(
-            end,
-            "PowerTransformerEnd.ratedS",
-            writer._quantity(getattr(winding, "rated_power", 0.0), "VA"),
-        )
-        writer._add_literal(
-            end, "PowerTransformerEnd.ratedU", writer._line_to_line_winding_voltage(winding)
-        )
-        writer._add_literal(end, "PowerTransformerEnd.r", writer._winding_resistance_ohm(winding))
-        writer._add_literal(
-            end, "PowerTransformerEnd.connectionKind", writer._connection_kind(winding)
-        )
-        writer._add_literal(end, "PowerTransformerEnd.phaseAngleClock", index - 1)
-        writer._add_literal(end, "TransformerEnd.endNumber", index)
-
-        terminal_id = writer._create_terminal(
-            root,
-            power_id,
-            bus_node_ids[bus.name],
-            f"{xfmr_name}:terminal:{index}",
-        )
-        terminal_ids.append(terminal_id)
-        writer._add_ref(end, "TransformerEnd.Terminal", terminal_id)
-        winding_base_voltage_id = writer._create_base_voltage(
-            root,
-            writer._line_to_line_winding_voltage(winding),
-            base_voltage_cache,
-        )
-        writer._add_ref(end, "TransformerEnd.BaseVoltage", winding_base_voltage_id)
+    winding_1, winding_2 = windings[0], windings[1]
+    connection_1 = writer._connection_kind(winding_1)
+    connection_2 = writer._connection_kind(winding_2)
+    writer._add_literal(power, "PowerTransformer.vectorGroup", connection_1 + connection_2)
 
-        tank_end_id = writer._deterministic_id("transformer_tank_end", f"{xfmr_name}:{index}")
-        tank_end_ids.append(tank_end_id)
+    # Only the first two windings are modelled, so both ends are emitted explicitly.
+    end_1_id, tank_end_1_id, terminal_1_id, r1 = _emit_power_transformer_end(
+        writer,
+        root,
+        xfmr_name,
+        power_id,
+        1,
+        winding_1,
+        connection_1,
+        bus_node_ids[bus_1.name],
+        base_voltage_cache,
+    )
+    end_2_id, tank_end_2_id, terminal_2_id, _ = _emit_power_transformer_end(
+        writer,
+        root,
+        xfmr_name,
+        power_id,
+        2,
+        winding_2,
+        connection_2,
+        bus_node_ids[bus_2.name],
+        base_voltage_cache,
+    )
 
     emit_transformer_mesh_impedance(
         writer,
         root,
         xfmr_name,
-        end_ids[0],
-        end_ids[1],
-        windings[0],
-        getattr(equipment, "winding_reactances", []),
+        end_1_id,
+        end_2_id,
+        winding_1,
+        equipment.winding_reactances,
+        r1,
+    )
+    return (
+        power_id,
+        [end_1_id, end_2_id],
+        [tank_end_1_id, tank_end_2_id],
+        [terminal_1_id, terminal_2_id],
     )
-    return power_id, end_ids, tank_end_ids, terminal_ids
 
 
 def emit_distribution_transformer(
@@ -126,14 +220,12 @@ def emit_distribution_transformer(
     bus_location_ids: dict[str, str],
     base_voltage_cache: dict[str, str],
 ) -> None:
-    if len(getattr(transformer, "buses", [])) < 2:
-        return
     emit_power_transformer(
         writer,
         root,
         transformer.name,
         transformer.buses,
-        getattr(transformer, "winding_phases", []),
+        transformer.winding_phases,
         transformer.equipment,
         bus_node_ids,
         bus_location_ids,
@@ -141,6 +233,51 @@ def emit_distribution_transformer(
     )
 
 
+def _emit_regulator_end(
+    writer,
+    root: ET.Element,
+    regulator_name: str,
+    index: int,
+    winding,
+    winding_phases: list,
+    tank_info_id: str,
+    tank_id: str,
+    tank_end_id: str,
+) -> tuple[str, float]:
+    """Emit one regulator TransformerEndInfo/TankEnd; return the end-info id and resistance."""
+    resistance = writer._winding_resistance_ohm(winding)
+    end_info_id = writer._deterministic_id("transformer_end_info", f"{regulator_name}:{index}")
+    _emit_winding_end(
+        writer,
+        root,
+        "TransformerEndInfo",
+        end_info_id,
+        f"{regulator_name}_end_{index}",
+        ("TransformerEndInfo.TransformerTankInfo", tank_info_id),
+        _END_INFO_PROPERTIES,
+        index,
+        winding,
+        writer._line_to_line_winding_voltage(winding),
+        resistance,
+        writer._connection_kind(winding),
+    )
+
+    tank_end = writer._create_identified_object(
+        root,
+        "TransformerTankEnd",
+        tank_end_id,
+        f"{regulator_name}_tank_end_{index}",
+    )
+    writer._add_ref(tank_end, "TransformerTankEnd.TransformerTank", tank_id)
+    phase_text = (
+        writer._winding_phases_text(winding_phases[index - 1])
+        if len(winding_phases) >= index
+        else "ABC"
+    )
+    writer._add_literal(tank_end, "TransformerTankEnd.orderedPhases", phase_text)
+    return end_info_id, resistance
+
+
 def emit_regulator(
     writer,
     root: ET.Element,
@@ -149,17 +286,16 @@ def emit_regulator(
     bus_location_ids: dict[str, str],
     base_voltage_cache: dict[str, str],
 ) -> None:
-    buses = list(getattr(regulator, "buses", []))
-    if len(buses) < 2:
-        return
-
+    buses = regulator.buses
+    location_id = bus_location_ids[buses[0].name]
+    winding_phases = regulator.winding_phases
     equipment = regulator.equipment
     power_id, _, tank_end_ids, power_terminal_ids = emit_power_transformer(
         writer,
         root,
         f"{regulator.name}_power",
         buses,
-        getattr(regulator, "winding_phases", []),
+        winding_phases,
         equipment,
         bus_node_ids,
         bus_location_ids,
@@ -176,51 +312,43 @@ def emit_regulator(
 
     tank_id = writer._deterministic_id("transformer_tank", regulator.name)
     tank = writer._create_identified_object(root, "TransformerTank", tank_id, regulator.name)
-    writer._add_ref(tank, "TransformerTank.TransformerTankInfo", tank_info_id)
-    writer._add_ref(tank, "TransformerTank.PowerTransformer", power_id)
-    writer._add_ref(tank, "PowerSystemResource.Location", bus_location_ids[buses[0].name])
-
-    windings = list(getattr(equipment, "windings", []))
-    for index, winding in enumerate(windings[:2], start=1):
-        end_info_id = writer._deterministic_id("transformer_end_info", f"{regulator.name}:{index}")
-        end_info = writer._create_identified_object(
-            root,
-            "TransformerEndInfo",
-            end_info_id,
-            f"{regulator.name}_end_{index}",
-        )
-        writer._add_ref(end_info, "TransformerEndInfo.TransformerTankInfo", tank_info_id)
-        writer._add_literal(
-            end_info,
-            "TransformerEndInfo.ratedS",
-            writer._quantity(getattr(winding, "rated_power", 0.0), "VA"),
-        )
-        writer._add_literal(
-            end_info, "TransformerEndInfo.ratedU", writer._line_to_line_winding_voltage(winding)
-        )
-        writer._add_literal(
-            end_info, "TransformerEndInfo.r", writer._winding_resistance_ohm(winding)
-        )
-        writer._add_literal(
-            end_info, "TransformerEndInfo.connectionKind", writer._connection_kind(winding)
-        )
-        writer._add_literal(end_info, "TransformerEndInfo.phaseAngleClock", index - 1)
-        writer._add_literal(end_info, "TransformerEndInfo.endNumber", index)
+    writer._add_refs(
+        tank,
+        (
+            ("TransformerTank.TransformerTankInfo", tank_info_id),
+            ("TransformerTank.PowerTransformer", power_id),
+            ("PowerSystemResource.Location", location_id),
+        ),
+    )
 
-        tank_end = writer._create_identified_object(
+    windings = equipment.windings
+    energised_end_id = None
+    r_test = 0.0
+    if tank_end_ids:
+        energised_end_id, r_test = _emit_regulator_end(
+            writer,
             root,
-            "TransformerTankEnd",
-            tank_end_ids[index - 1],
-            f"{regulator.name}_tank_end_{index}",
+            regulator.name,
+            1,
+            windings[0],
+            winding_phases,
+            tank_info_id,
+            tank_id,
+            tank_end_ids[0],
         )
-        writer._add_ref(tank_end, "TransformerTankEnd.TransformerTank", tank_id)
-        phases = getattr(regulator, "winding_phases", [])
-        phase_text = (
-            writer._winding_phases_text(phases[index - 1]) if len(phases) >= index else "ABC"
+        _emit_regulator_end(
+            writer,
+            root,
+            regulator.name,
+            2,
+            windings[1],
+            winding_phases,
+            tank_info_id,
+            tank_id,
+            tank_end_ids[1],
         )
-        writer._add_literal(tank_end, "TransformerTankEnd.orderedPhases", phase_text)
 
-    controllers = list(getattr(regulator, "controllers", []))
+    controllers = regulator.controllers
     controller = controllers[0] if controllers else None
     if controller is None:
         return
@@ -244,29 +372,26 @@ def emit_regulator(
         current_step,
     ) = writer._tap_step_values(primary_winding)
 
-    writer._add_literal(tap_changer, "TapChanger.highStep", high_step)
-    writer._add_literal(tap_changer, "TapChanger.lowStep", low_step)
-    writer._add_literal(tap_changer, "TapChanger.neutralStep", neutral_step)
-    writer._add_literal(tap_changer, "TapChanger.normalStep", normal_step)
-    writer._add_literal(tap_changer, "RatioTapChanger.stepVoltageIncrement", dv_percent)
-    writer._add_literal(tap_changer, "TapChanger.step", current_step)
-    writer._add_literal(
-        tap_changer, "TapChanger.neutralU", writer._quantity(controller.v_setpoint, "volt")
-    )
-    writer._add_literal(
-        tap_changer, "TapChanger.initialDelay", writer._quantity(controller.delay, "second")
-    )
-    writer._add_literal(
-        tap_changer, "TapChanger.subsequentDelay", writer._quantity(controller.delay, "second")
-    )
-    writer._add_literal(tap_changer, "TapChanger.ltcFlag", "true")
-    writer._add_literal(tap_changer, "TapChanger.controlEnabled", "true")
-    writer._add_literal(
-        tap_changer, "TapChanger.ptRatio", float(getattr(controller, "pt_ratio", 1.0))
-    )
-    writer._add_literal(tap_changer, "TapChanger.ctRatio", 1.0)
-    writer._add_literal(
-        tap_changer, "TapChanger.ctRating", writer._quantity(controller.ct_primary, "ampere")
+    v_setpoint = writer._quantity(controller.v_setpoint, "volt")
+    delay = writer._quantity(controller.delay, "second")
+    writer._add_literals(
+        tap_changer,
+        (
+            ("TapChanger.highStep", high_step),
+            ("TapChanger.lowStep", low_step),
+            ("TapChanger.neutralStep", neutral_step),
+            ("TapChanger.normalStep", normal_step),
+            ("RatioTapChanger.stepVoltageIncrement", dv_percent),
+            ("TapChanger.step", current_step),
+            ("TapChanger.neutralU", v_setpoint),
+            ("TapChanger.initialDelay", delay),
+            ("TapChanger.subsequentDelay", delay),
+            ("TapChanger.ltcFlag", "true"),
+            ("TapChanger.controlEnabled", "true"),
+            ("TapChanger.ptRatio", float(controller.pt_ratio)),
+            ("TapChanger.ctRatio", 1.0),
+            ("TapChanger.ctRating", writer._quantity(controller.ct_primary, "ampere")),
+        ),
     )
 
     control_id = writer._deterministic_id("tap_changer_control", regulator.name)
@@ -279,44 +404,32 @@ def emit_regulator(
     writer._add_ref(tap_changer, "TapChanger.TapChangerControl", control_id)
 
     writer._add_literal(control, "RegulatingControl.mode", "voltage")
-    writer._add_ref(control, "RegulatingControl.Terminal", power_terminal_ids[0])
-    writer._add_ref(control, "PowerSystemResource.Location", bus_location_ids[buses[0].name])
-    writer._add_literal(
-        control,
-        "RegulatingControl.monitoredPhase",
-        writer._phase_text(controller.controlled_phase),
-    )
-    writer._add_literal(
-        control, "RegulatingControl.targetValue", writer._quantity(controller.v_setpoint, "volt")
-    )
-    writer._add_literal(
-        control, "RegulatingControl.targetDeadband", writer._quantity(controller.bandwidth, "volt")
-    )
-    writer._add_literal(
-        control,
-        "TapChangerControl.lineDropCompensation",
-        str(getattr(controller, "use_ldc", False)).lower(),
-    )
-    writer._add_literal(
-        control, "TapChangerControl.lineDropR", writer._quantity(controller.ldc_R, "volt")
-    )
-    writer._add_literal(
-        control, "TapChangerControl.lineDropX", writer._quantity(controller.ldc_X, "volt")
-    )
-    writer._add_literal(
-        control,
-        "TapChangerControl.reversible",
-        str(getattr(controller, "is_reversible", False)).lower(),
-    )
-    writer._add_literal(
+    writer._add_refs(
         control,
-        "TapChangerControl.maxLimitVoltage",
-        writer._quantity(controller.max_v_limit, "volt"),
+        (
+            ("RegulatingControl.Terminal", power_terminal_ids[0]),
+            ("PowerSystemResource.Location", location_id),
+        ),
     )
-    writer._add_literal(
+    writer._add_literals(
         control,
-        "TapChangerControl.minLimitVoltage",
-        writer._quantity(controller.min_v_limit, "volt"),
+        (
+            ("RegulatingControl.monitoredPhase", writer._phase_text(controller.controlled_phase)),
+            ("RegulatingControl.targetValue", v_setpoint),
+            ("RegulatingControl.targetDeadband", writer._quantity(controller.bandwidth, "volt")),
+            ("TapChangerControl.lineDropCompensation", "true" if controller.use_ldc else "false"),
+            ("TapChangerControl.lineDropR", writer._quantity(controller.ldc_R, "volt")),
+            ("TapChangerControl.lineDropX", writer._quantity(controller.ldc_X, "volt")),
+            ("TapChangerControl.reversible", "true" if controller.is_reversible else "false"),
+            (
+                "TapChangerControl.maxLimitVoltage",
+                writer._quantity(controller.max_v_limit, "volt"),
+            ),
+            (
+                "TapChangerControl.minLimitVoltage",
+                writer._quantity(controller.min_v_limit, "volt"),
+            ),
+        ),
     )
 
     short_test_id = writer._deterministic_id("short_circuit_test", regulator.name)
@@ -328,16 +441,18 @@ def emit_regulator(
     )
     x_test = (
         writer._winding_reactance_ohm(primary_winding, equipment.winding_reactances[0])
-        if getattr(equipment, "winding_reactances", []) and primary_winding
+        if equipment.winding_reactances and primary_winding
         else 0.0
     )
-    r_test = writer._winding_resistance_ohm(primary_winding) if primary_winding else 0.0
-    writer._add_ref(
+    if energised_end_id is None:
+        energised_end_id = writer._deterministic_id("transformer_end_info", f"{regulator.name}:1")
+    writer._add_ref(short_test, "ShortCircuitTest.EnergisedEnd", energised_end_id)
+    writer._add_literals(
         short_test,
-        "ShortCircuitTest.EnergisedEnd",
-        writer._deterministic_id("transformer_end_info", f"{regulator.name}:1"),
+        (
+            ("ShortCircuitTest.leakageImpedance", x_test),
+            ("ShortCircuitTest.leakageImpedanceZero", x_test),
+            ("ShortCircuitTest.loss", r_test),
+            ("ShortCircuitTest.lossZero", r_test),
+        ),
     )
-    writer._add_literal(short_test, "ShortCircuitTest.leakageImpedance", x_test)
-    writer._add_literal(short_test, "ShortCircuitTest.leakageImpedanceZero", x_test)
-    writer._add_literal(short_test, "ShortCircuitTest.loss", r_test)
-    writer._add_literal(short_test, "ShortCircuitTest.lossZero", r_test)
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
 import re
-from uuid import NAMESPACE_URL, uuid5
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from itertools import chain
+from hashlib import sha1
+from uuid import NAMESPACE_URL, UUID
 from collections import defaultdict
 from pathlib import Path
-import xml.etree.ElementTree as ET
+from typing import Callable
+from lxml import etree as ET
 
+from ditto.constants import LL_LN_CONVERSION_FACTOR
 from ditto.writers.abstract_writer import AbstractWriter
 from ditto.writers.cim_iec_61968_13.equipment_emitters.source import emit_energy_source
 from ditto.writers.cim_iec_61968_13.equipment_emitters.load import emit_energy_consumer
@@ -23,36 +33,150 @@ from ditto.writers.cim_iec_61968_13.equipment_emitters.transformer import (
 
 RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
 CIM_NS = "http://iec.ch/TC57/CIM100#"
+NSMAP = {"cim": CIM_NS, "rdf": RDF_NS}
+_RDF_ABOUT = sys.intern(f"{{{RDF_NS}}}about")
+_RDF_RESOURCE = sys.intern(f"{{{RDF_NS}}}resource")
+_XML_DECLARATION = b"<?xml version='1.0' encoding='utf-8'?>\n"
+_PLAIN_TEXT_TYPES = frozenset({float, int, str})
+# Emitted elements are serialized and released once the root buffers this many children.
+STREAM_FLUSH_ELEMENTS = 4096
 
-ET.register_namespace("rdf", RDF_NS)
-ET.register_namespace("cim", CIM_NS)
+
+def _no_flush() -> None:
+    return None
+
+
+_SINGLE_BUS_EMITTERS = (
+    ("DistributionVoltageSource", emit_energy_source),
+    ("DistributionLoad", emit_energy_consumer),
+    ("DistributionCapacitor", emit_capacitor),
+    ("DistributionSolar", emit_solar),
+    ("DistributionBattery", emit_battery),
+)
+
+# (writer, components, output_file) jobs of the pool a forked package-mode worker belongs to.
+# Only ever assigned inside the worker, so concurrent writes in the parent cannot interfere.
+_FORKED_WRITES: list[tuple] = []
+
+
+def _init_forked_worker(writes: list[tuple]) -> None:
+    # Fork-context initargs are inherited by the child, never pickled.
+    _FORKED_WRITES[:] = writes
+
+
+def _stream_forked_write(index: int) -> None:
+    writer, components, output_file = _FORKED_WRITES[index]
+    writer._stream_xml(components, output_file)
+
+
+@lru_cache(maxsize=None)
+def _cim_tag(suffix: str) -> str:
+    # Dotted CIM property names are never auto-interned; intern the qualified tag once.
+    return sys.intern(f"{{{CIM_NS}}}{suffix}")
+
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@lru_cache(maxsize=None)
+def _camel_to_snake(name: str) -> str:
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
+
+
+# \w matches exactly the str.isalnum() characters plus "_".
+_UNSAFE_GROUP_CHARS = re.compile(r"[^\w-]")
+
+
+@lru_cache(maxsize=4096)
+def _safe_group_name(value: str) -> str:
+    # Substation/feeder names repeat for every component of a group, hence the cache.
+    return _UNSAFE_GROUP_CHARS.sub("_", value).strip("_") or "unknown"
+
+
+@lru_cache(maxsize=None)
+def _kind_hasher(kind: str):
+    return sha1(NAMESPACE_URL.bytes + f"ditto-cim:{kind}:".encode())
+
+
+def _uuid5_text(kind: str, name: str) -> str:
+    """Equivalent to ``str(uuid5(NAMESPACE_URL, f"ditto-cim:{kind}:{name}"))``.
+
+    The namespace and kind prefix are hashed once per kind and the digest state is copied
+    for each name, so only the name itself is hashed per call.
+    """
+    hasher = _kind_hasher(kind).copy()
+    hasher.update(name.encode())
+    return str(UUID(bytes=hasher.digest()[:16], version=5))
+
+
+def _winding_ohm(percent: float, rated_power: float, rated_voltage: float) -> float:
+    """Convert a percent impedance on the winding base to ohms."""
+    if rated_power <= 0.0:
+        return 0.0
+    return percent / 100.0 * (rated_voltage**2 / rated_power)
+
+
+@lru_cache(maxsize=1024)
+def _tap_steps(
+    total_taps: int, max_tap_pu: float, min_tap_pu: float, tap_position: float
+) -> tuple[float, int, int, int, int, int]:
+    # Regulators in a model share a handful of tap configurations.
+    dv_pu = (max_tap_pu - min_tap_pu) / total_taps if total_taps > 0 else 0.00625
+    if dv_pu <= 0:
+        dv_pu = 0.00625
+    dv_percent = dv_pu * 100.0
+
+    high_step = int(round((max_tap_pu - 1.0) / dv_pu))
+    low_step = int(round((min_tap_pu - 1.0) / dv_pu))
+    normal_step = int(round((tap_position - 1.0) / dv_pu))
+    neutral_step = 0
+    current_step = normal_step
+    return dv_percent, high_step, low_step, neutral_step, normal_step, current_step
 
 
 class Writer(AbstractWriter):
-    _SUPPORTED_COMPONENT_TYPES = {
-        "DistributionBus",
-        "DistributionVoltageSource",
-        "DistributionLoad",
-        "MatrixImpedanceBranch",
-        "DistributionTransformer",
-        "DistributionRegulator",
-        "DistributionCapacitor",
-        "MatrixImpedanceSwitch",
-        "DistributionSolar",
-        "DistributionBattery",
-        "MatrixImpedanceFuse",
-    }
+    _SUPPORTED_COMPONENT_TYPES: frozenset[str] = frozenset(
+        {
+            "DistributionBus",
+            "DistributionVoltageSource",
+            "DistributionLoad",
+            "MatrixImpedanceBranch",
+            "DistributionTransformer",
+            "DistributionRegulator",
+            "DistributionCapacitor",
+            "MatrixImpedanceSwitch",
+            "DistributionSolar",
+            "DistributionBattery",
+            "MatrixImpedanceFuse",
+        }
+    )
+
+    def __init__(self, system):
+        super().__init__(system)
+        self._id_cache: dict[tuple[str, str], str] = {}
+        self._quantity_cache: dict[tuple, float] = {}
+        self._unit_factor_cache: dict[tuple, float] = {}
+        self._phase_text_cache: dict = {}
+        self._phase_templates: dict[tuple[str, str, str], ET.Element] = {}
+        self._winding_vll_cache: dict[int, float] = {}
 
     def _rdf(self, suffix: str) -> str:
         return f"{{{RDF_NS}}}{suffix}"
 
     def _cim(self, suffix: str) -> str:
-        return f"{{{CIM_NS}}}{suffix}"
+        return _cim_tag(suffix)
 
     def _deterministic_id(self, kind: str, name: str) -> str:
-        return str(uuid5(NAMESPACE_URL, f"ditto-cim:{kind}:{name}"))
+        key = (kind, name)
+        cached = self._id_cache.get(key)
+        if cached is None:
+            cached = self._id_cache[key] = _uuid5_text(kind, name)
+        return cached
 
     def _safe_text(self, value) -> str:
+        if value.__class__ in _PLAIN_TEXT_TYPES:
+            # Exact-type check so str/int enum subclasses still render their ``.value``.
+            return str(value)
         if value is None:
             return ""
         if hasattr(value, "value"):
@@ -60,126 +184,193 @@ class Writer(AbstractWriter):
         return str(value)
 
     def _add_literal(self, element: ET.Element, prop: str, value) -> None:
-        child = ET.SubElement(element, self._cim(prop))
+        child = ET.SubElement(element, _cim_tag(prop))
         child.text = self._safe_text(value)
 
+    def _add_literals(self, element: ET.Element, items) -> None:
+        """Add several ``(prop, value)`` literals to ``element`` in order."""
+        sub_element = ET.SubElement
+        cim = _cim_tag
+        safe_text = self._safe_text
+        for prop, value in items:
+            sub_element(element, cim(prop)).text = safe_text(value)
+
     def _add_ref(self, element: ET.Element, prop: str, ref_id: str) -> None:
-        ET.SubElement(
-            element,
-            self._cim(prop),
-            attrib={self._rdf("resource"): f"#{ref_id}"},
-        )
+        ET.SubElement(element, _cim_tag(prop), attrib={_RDF_RESOURCE: f"#{ref_id}"})
+
+    def _add_refs(self, element: ET.Element, items) -> None:
+        """Add several ``(prop, ref_id)`` resource references to ``element`` in order."""
+        sub_element = ET.SubElement
+        cim = _cim_tag
+        for prop, ref_id in items:
+            sub_element(element, cim(prop), attrib={_RDF_RESOURCE: f"#{ref_id}"})
 
     def _build_root(self) -> ET.Element:
-        return ET.Element(self._rdf("RDF"))
+        return ET.Element(self._rdf("RDF"), nsmap=NSMAP)
 
     def _create_identified_object(self, root: ET.Element, class_name: str, obj_id: str, name: str):
-        element = ET.SubElement(
-            root, self._cim(class_name), attrib={self._rdf("about"): f"#{obj_id}"}
-        )
+        element = ET.SubElement(root, _cim_tag(class_name), attrib={_RDF_ABOUT: f"#{obj_id}"})
         self._add_literal(element, "IdentifiedObject.name", name)
         self._add_literal(element, "IdentifiedObject.mRID", obj_id)
         return element
 
+    def _emit_phases(
+        self,
+        root: ET.Element,
+        class_name: str,
+        id_kind: str,
+        id_key: str,
+        name: str,
+        phases,
+        parent_prop: str,
+        parent_id: str,
+        phase_prop: str,
+    ) -> None:
+        """Emit one ``class_name`` element per phase, each referencing ``parent_id``.
+
+        Phase elements are copied from a per-class template and only their ids and texts are
+        patched, which is cheaper than building the five elements one by one.
+        """
+        template = self._phase_template(class_name, parent_prop, phase_prop)
+        deterministic_id = self._deterministic_id
+        phase_text = self._phase_text
+        append = root.append
+        parent_ref = f"#{parent_id}"
+        id_prefix = f"{id_key}:"
+        name_prefix = f"{name}_phase_"
+        for index, phase in enumerate(phases, start=1):
+            phase_id = deterministic_id(id_kind, f"{id_prefix}{index}")
+            phase_element = deepcopy(template)
+            phase_element.set(_RDF_ABOUT, f"#{phase_id}")
+            name_child, mrid_child, parent_child, phase_child = phase_element
+            name_child.text = f"{name_prefix}{index}"
+            mrid_child.text = phase_id
+            parent_child.set(_RDF_RESOURCE, parent_ref)
+            phase_child.text = phase_text(phase)
+            append(phase_element)
+
+    def _phase_template(self, class_name: str, parent_prop: str, phase_prop: str) -> ET.Element:
+        key = (class_name, parent_prop, phase_prop)
+        template = self._phase_templates.get(key)
+        if template is None:
+            template = self._create_identified_object(self._build_root(), class_name, "", "")
+            self._add_ref(template, parent_prop, "")
+            self._add_literal(template, phase_prop, "")
+            self._phase_templates[key] = template
+        return template
+
     def _quantity(self, value, unit: str | None = None) -> float:
         if value is None:
             return 0.0
         if hasattr(value, "to") and unit is not None:
-            return float(value.to(unit).magnitude)
+            magnitude = value.magnitude
+            if not isinstance(magnitude, float):
+                return float(value.to(unit).magnitude)
+            # Scalar conversions repeat heavily across devices (same ratings, same units).
+            # Keyed on hex() so 0.0 and -0.0 (equal as floats) keep their own sign.
+            key = (magnitude.hex(), value.units, unit)
+            cached = self._quantity_cache.get(key)
+            if cached is None:
+                cached = self._quantity_cache[key] = float(value.to(unit).magnitude)
+            return cached
         if hasattr(value, "magnitude"):
             return float(value.magnitude)
         return float(value)
 
+    def _unit_factor(self, units, unit: str) -> float:
+        """Return the multiplier converting magnitudes in ``units`` to ``unit``."""
+        key = (units, unit)
+        factor = self._unit_factor_cache.get(key)
+        if factor is None:
+            factor = self._unit_factor_cache[key] = float((1.0 * units).to(unit).magnitude)
+        return factor
+
     def _bus_nominal_voltage(self, bus) -> float:
-        return self._quantity(bus.rated_voltage, "volt") * 1.732
+        return self._quantity(bus.rated_voltage, "volt") * LL_LN_CONVERSION_FACTOR
 
     def _phase_text(self, phase) -> str:
-        text = self._safe_text(phase)
-        return text.replace("Phase.", "")
+        cached = self._phase_text_cache.get(phase)
+        if cached is None:
+            cached = self._phase_text_cache[phase] = self._safe_text(phase).replace("Phase.", "")
+        return cached
 
     def _connection_kind(self, winding) -> str:
         connection = self._safe_text(getattr(winding, "connection_type", "STAR"))
         return "D" if "DELTA" in connection else "Y"
 
     def _line_to_line_winding_voltage(self, winding) -> float:
-        phase_voltage = self._quantity(getattr(winding, "rated_voltage", 0.0), "volt")
-        num_phases = int(getattr(winding, "num_phases", 1) or 1)
-        return phase_voltage * 1.732 if num_phases > 1 else phase_voltage
+        # Keyed by id(): windings stay referenced by the system for the whole write pass,
+        # and the cache is cleared at the start of each pass.
+        key = id(winding)
+        voltage = self._winding_vll_cache.get(key)
+        if voltage is None:
+            phase_voltage = self._quantity(getattr(winding, "rated_voltage", 0.0), "volt")
+            num_phases = int(getattr(winding, "num_phases", 1) or 1)
+            voltage = phase_voltage * LL_LN_CONVERSION_FACTOR if num_phases > 1 else phase_voltage
+            self._winding_vll_cache[key] = voltage
+        return voltage
 
     def _winding_resistance_ohm(self, winding) -> float:
-        rated_power = self._quantity(getattr(winding, "rated_power", 0.0), "VA")
-        rated_voltage = self._line_to_line_winding_voltage(winding)
-        if rated_power <= 0.0:
-            return 0.0
-        return (
-            float(getattr(winding, "resistance", 0.0)) / 100.0 * (rated_voltage**2 / rated_power)
+        return _winding_ohm(
+            float(getattr(winding, "resistance", 0.0)),
+            self._quantity(getattr(winding, "rated_power", 0.0), "VA"),
+            self._line_to_line_winding_voltage(winding),
         )
 
     def _winding_reactance_ohm(self, winding, per_x: float | None) -> float:
-        rated_power = self._quantity(getattr(winding, "rated_power", 0.0), "VA")
-        rated_voltage = self._line_to_line_winding_voltage(winding)
-        if rated_power <= 0.0 or per_x is None:
+        if per_x is None:
             return 0.0
-        return float(per_x) / 100.0 * (rated_voltage**2 / rated_power)
+        return _winding_ohm(
+            float(per_x),
+            self._quantity(getattr(winding, "rated_power", 0.0), "VA"),
+            self._line_to_line_winding_voltage(winding),
+        )
 
     def _winding_phases_text(self, winding_phases: list) -> str:
         return "".join(self._phase_text(phase) for phase in winding_phases)
 
     def _tap_step_values(self, winding) -> tuple[float, int, int, int, int, int]:
-        total_taps = int(getattr(winding, "total_taps", 32) or 32)
-        max_tap_pu = float(getattr(winding, "max_tap_pu", 1.1) or 1.1)
-        min_tap_pu = float(getattr(winding, "min_tap_pu", 0.9) or 0.9)
-        tap_position = float(getattr(winding, "tap_positions", [1.0])[0] or 1.0)
-
-        dv_pu = (max_tap_pu - min_tap_pu) / total_taps if total_taps > 0 else 0.00625
-        if dv_pu <= 0:
-            dv_pu = 0.00625
-        dv_percent = dv_pu * 100.0
-
-        high_step = int(round((max_tap_pu - 1.0) / dv_pu))
-        low_step = int(round((min_tap_pu - 1.0) / dv_pu))
-        normal_step = int(round((tap_position - 1.0) / dv_pu))
-        neutral_step = 0
-        current_step = normal_step
-        return dv_percent, high_step, low_step, neutral_step, normal_step, current_step
+        # Explicit None checks: a valid zero (e.g. min_tap_pu=0.0) must not fall back.
+        total_taps = getattr(winding, "total_taps", None)
+        max_tap_pu = getattr(winding, "max_tap_pu", None)
+        min_tap_pu = getattr(winding, "min_tap_pu", None)
+        tap_positions = getattr(winding, "tap_positions", None)
+        return _tap_steps(
+            32 if total_taps is None else int(total_taps),
+            1.1 if max_tap_pu is None else float(max_tap_pu),
+            0.9 if min_tap_pu is None else float(min_tap_pu),
+            float(tap_positions[0]) if tap_positions else 1.0,
+        )
 
     def _camel_to_snake(self, name: str) -> str:
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
-
-    def _component_type_key(self, component) -> str | None:
-        component_type = component.__class__.__name__
-        if component_type in self._SUPPORTED_COMPONENT_TYPES:
-            return component_type
-        return None
+        return _camel_to_snake(name)
 
     def _combine_with_required_buses(self, components: list, buses: list) -> list:
         bus_names = {bus.name for bus in buses}
-        merged = []
-        seen = set()
-
-        for bus in buses:
-            key = (bus.__class__.__name__, bus.name)
-            seen.add(key)
-            merged.append(bus)
+        merged = list(buses)
+        seen = {(bus.__class__.__name__, bus.name) for bus in buses}
 
         for component in components:
-            key = (component.__class__.__name__, getattr(component, "name", str(id(component))))
+            class_name = component.__class__.__name__
+            key = (class_name, getattr(component, "name", str(id(component))))
             if key in seen:
                 continue
             seen.add(key)
 
-            if component.__class__.__name__ == "DistributionBus":
+            if class_name == "DistributionBus":
                 merged.append(component)
                 continue
 
-            if hasattr(component, "bus") and getattr(component, "bus", None) is not None:
-                if component.bus.name in bus_names:
+            bus = getattr(component, "bus", None)
+            if bus is not None:
+                if bus.name in bus_names:
                     merged.append(component)
                 continue
 
-            if hasattr(component, "buses") and getattr(component, "buses", None):
-                buses_list = [bus.name for bus in component.buses]
-                if all(name in bus_names for name in buses_list):
+            component_buses = getattr(component, "buses", None)
+            if component_buses:
+                # Generator so the check stops at the first bus outside this group.
+                if all(bus.name in bus_names for bus in component_buses):
                     merged.append(component)
                 continue
 
@@ -205,39 +396,60 @@ class Writer(AbstractWriter):
         cache[key] = base_voltage_id
         return base_voltage_id
 
+    def _bus_base_voltage_id(self, root: ET.Element, bus, cache: dict[str, str]) -> str:
+        """Return the BaseVoltage id for ``bus``, memoized per bus in ``cache``.
+
+        Per-bus entries are keyed by ``bus:<name>`` so they cannot collide with the
+        formatted-voltage keys used by ``_create_base_voltage``.
+        """
+        key = f"bus:{bus.name}"
+        base_voltage_id = cache.get(key)
+        if base_voltage_id is None:
+            base_voltage_id = cache[key] = self._create_base_voltage(
+                root, self._bus_nominal_voltage(bus), cache
+            )
+        return base_voltage_id
+
     def _create_bus_objects(
         self,
         root: ET.Element,
         buses: list,
         bus_node_ids: dict[str, str],
         bus_location_ids: dict[str, str],
+        flush: Callable[[], None] = _no_flush,
     ) -> None:
+        deterministic_id = self._deterministic_id
+        create_object = self._create_identified_object
         for bus in buses:
             bus_name = bus.name
-            node_id = self._deterministic_id("connectivity_node", bus_name)
+            node_id = deterministic_id("connectivity_node", bus_name)
             bus_node_ids[bus_name] = node_id
-            self._create_identified_object(root, "ConnectivityNode", node_id, bus_name)
+            create_object(root, "ConnectivityNode", node_id, bus_name)
 
-            location_id = self._deterministic_id("location", bus_name)
+            location_id = deterministic_id("location", bus_name)
             bus_location_ids[bus_name] = location_id
-            location = self._create_identified_object(
-                root, "Location", location_id, f"Location_{bus_name}"
-            )
+            location = create_object(root, "Location", location_id, f"Location_{bus_name}")
 
-            position_id = self._deterministic_id("position_point", bus_name)
-            position = self._create_identified_object(
+            position_id = deterministic_id("position_point", bus_name)
+            position = create_object(
                 root,
                 "PositionPoint",
                 position_id,
                 f"Position_{bus_name}",
             )
             coordinate = getattr(bus, "coordinate", None)
-            x = getattr(coordinate, "x", 0.0)
-            y = getattr(coordinate, "y", 0.0)
-            self._add_literal(position, "PositionPoint.xPosition", x)
-            self._add_literal(position, "PositionPoint.yPosition", y)
+            if coordinate is None:
+                x = y = 0.0
+            else:
+                x = coordinate.x
+                y = coordinate.y
+            self._add_literals(
+                position,
+                (("PositionPoint.xPosition", x), ("PositionPoint.yPosition", y)),
+            )
             self._add_ref(position, "PositionPoint.Location", location_id)
             self._add_literal(location, "IdentifiedObject.mRID", location_id)
+            flush()
 
     def _create_terminal(
         self,
@@ -252,8 +464,13 @@ class Writer(AbstractWriter):
         terminal = self._create_identified_object(
             root, "Terminal", terminal_id, f"Terminal_{suffix}"
         )
-        self._add_ref(terminal, "Terminal.ConductingEquipment", equipment_id)
-        self._add_ref(terminal, "Terminal.ConnectivityNode", node_id)
+        self._add_refs(
+            terminal,
+            (
+                ("Terminal.ConductingEquipment", equipment_id),
+                ("Terminal.ConnectivityNode", node_id),
+            ),
+        )
 
         if with_limits:
             limit_set_id = self._deterministic_id("operational_limit_set", terminal_id)
@@ -292,8 +509,7 @@ class Writer(AbstractWriter):
 
     @staticmethod
     def _safe_group_name(value: str) -> str:
-        cleaned = "".join(char if char.isalnum() or char in "-_" else "_" for char in value)
-        return cleaned.strip("_") or "unknown"
+        return _safe_group_name(value)
 
     def _get_component_group(self, component) -> tuple[str, str]:
         substation_name = "default_substation"
@@ -311,9 +527,33 @@ class Writer(AbstractWriter):
 
     @staticmethod
     def _write_xml(root: ET.Element, output_file: Path) -> None:
-        tree = ET.ElementTree(root)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        tree.write(output_file, encoding="utf-8", xml_declaration=True)
+        output_file.write_bytes(ET.tostring(root, encoding="utf-8", xml_declaration=True))
+
+    def _stream_xml(self, components: list, output_file: Path) -> None:
+        """Emit ``components`` and write them to ``output_file`` incrementally.
+
+        Emitters append to a detached ``rdf:RDF`` buffer that is serialized and cleared every
+        ``STREAM_FLUSH_ELEMENTS`` children, so peak memory no longer grows with the feeder.
+        The bytes match ``_write_xml`` on the fully built tree.
+        """
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        root = self._build_root()
+        head = ET.tostring(root, encoding="utf-8")[:-2] + b">"
+        tail = f"</{root.prefix}:RDF>".encode()
+
+        with output_file.open("wb") as handle:
+            handle.write(_XML_DECLARATION)
+            handle.write(head)
+
+            def flush(force: bool = False) -> None:
+                if len(root) and (force or len(root) >= STREAM_FLUSH_ELEMENTS):
+                    handle.write(ET.tostring(root, encoding="utf-8")[len(head) : -len(tail)])
+                    root.clear()
+
+            self._populate_core_graph(root, components, flush)
+            flush(force=True)
+            handle.write(tail)
 
     @staticmethod
     def _components_by_name(components: list) -> dict[str, list]:
@@ -323,16 +563,24 @@ class Writer(AbstractWriter):
         return grouped_components
 
     @staticmethod
-    def _has_single_bus(component, bus_node_ids: dict[str, str]) -> bool:
-        bus = getattr(component, "bus", None)
-        return bus is not None and bus.name in bus_node_ids
+    def _single_bus_components(components: list, bus_node_ids: dict[str, str]) -> list:
+        """Keep components whose bus was emitted; emitters rely on this and do not re-check."""
+        valid = []
+        for component in components:
+            bus = getattr(component, "bus", None)
+            if bus is not None and bus.name in bus_node_ids:
+                valid.append(component)
+        return valid
 
     @staticmethod
-    def _has_two_buses(component, bus_node_ids: dict[str, str]) -> bool:
-        buses = list(getattr(component, "buses", []))
-        if len(buses) < 2:
-            return False
-        return buses[0].name in bus_node_ids and buses[1].name in bus_node_ids
+    def _two_bus_components(components: list, bus_node_ids: dict[str, str]) -> list:
+        """Keep components whose first two buses were emitted; emitters do not re-check."""
+        valid = []
+        for component in components:
+            buses = getattr(component, "buses", None) or ()
+            if len(buses) >= 2 and buses[0].name in bus_node_ids and buses[1].name in bus_node_ids:
+                valid.append(component)
+        return valid
 
     def _emit_single_bus_components(
         self,
@@ -341,20 +589,14 @@ class Writer(AbstractWriter):
         bus_node_ids: dict[str, str],
         bus_location_ids: dict[str, str],
         base_voltage_cache: dict[str, str],
+        flush: Callable[[], None] = _no_flush,
     ) -> None:
-        single_bus_emitters = [
-            ("DistributionVoltageSource", emit_energy_source),
-            ("DistributionLoad", emit_energy_consumer),
-            ("DistributionCapacitor", emit_capacitor),
-            ("DistributionSolar", emit_solar),
-            ("DistributionBattery", emit_battery),
-        ]
-
-        for component_name, emitter in single_bus_emitters:
-            for component in components_by_name.get(component_name, []):
-                if not self._has_single_bus(component, bus_node_ids):
-                    continue
+        for component_name, emitter in _SINGLE_BUS_EMITTERS:
+            for component in self._single_bus_components(
+                components_by_name.get(component_name, []), bus_node_ids
+            ):
                 emitter(self, root, component, bus_node_ids, bus_location_ids, base_voltage_cache)
+                flush()
 
     def _emit_two_bus_components(
         self,
@@ -364,10 +606,14 @@ class Writer(AbstractWriter):
         bus_location_ids: dict[str, str],
         base_voltage_cache: dict[str, str],
         emitted_line_code_ids: set[str],
+        flush: Callable[[], None] = _no_flush,
     ) -> None:
-        for branch in components_by_name.get("MatrixImpedanceBranch", []):
-            if not self._has_two_buses(branch, bus_node_ids):
-                continue
+        def valid(component_name: str) -> list:
+            return self._two_bus_components(
+                components_by_name.get(component_name, []), bus_node_ids
+            )
+
+        for branch in valid("MatrixImpedanceBranch"):
             emit_line_segment(
                 self,
                 root,
@@ -377,10 +623,9 @@ class Writer(AbstractWriter):
                 base_voltage_cache,
                 emitted_line_code_ids,
             )
+            flush()
 
-        for transformer in components_by_name.get("DistributionTransformer", []):
-            if not self._has_two_buses(transformer, bus_node_ids):
-                continue
+        for transformer in valid("DistributionTransformer"):
             emit_distribution_transformer(
                 self,
                 root,
@@ -389,21 +634,26 @@ class Writer(AbstractWriter):
                 bus_location_ids,
                 base_voltage_cache,
             )
+            flush()
 
-        for regulator in components_by_name.get("DistributionRegulator", []):
-            if not self._has_two_buses(regulator, bus_node_ids):
-                continue
+        for regulator in valid("DistributionRegulator"):
             emit_regulator(
                 self, root, regulator, bus_node_ids, bus_location_ids, base_voltage_cache
             )
+            flush()
 
-        for switch in components_by_name.get("MatrixImpedanceSwitch", []):
+        for switch in valid("MatrixImpedanceSwitch"):
             emit_switch(self, root, switch, bus_node_ids, bus_location_ids, base_voltage_cache)
+            flush()
 
-        for fuse in components_by_name.get("MatrixImpedanceFuse", []):
+        for fuse in valid("MatrixImpedanceFuse"):
             emit_fuse(self, root, fuse, bus_node_ids, bus_location_ids, base_voltage_cache)
+            flush()
 
-    def _populate_core_graph(self, root: ET.Element, components: list) -> None:
+    def _populate_core_graph(
+        self, root: ET.Element, components: list, flush: Callable[[], None] = _no_flush
+    ) -> None:
+        self._winding_vll_cache.clear()
         components_by_name = self._components_by_name(components)
         buses = components_by_name.get("DistributionBus", [])
 
@@ -412,7 +662,7 @@ class Writer(AbstractWriter):
         base_voltage_cache: dict[str, str] = {}
         emitted_line_code_ids: set[str] = set()
 
-        self._create_bus_objects(root, buses, bus_node_ids, bus_location_ids)
+        self._create_bus_objects(root, buses, bus_node_ids, bus_location_ids, flush)
 
         self._emit_single_bus_components(
             root,
@@ -420,6 +670,7 @@ class Writer(AbstractWriter):
             bus_node_ids,
             bus_location_ids,
             base_voltage_cache,
+            flush,
         )
 
         self._emit_two_bus_components(
@@ -429,6 +680,7 @@ class Writer(AbstractWriter):
             bus_location_ids,
             base_voltage_cache,
             emitted_line_code_ids,
+            flush,
         )
 
     def _collect_components(self, component_types: list[type]) -> list:
@@ -444,14 +696,23 @@ class Writer(AbstractWriter):
         separate_feeders: bool,
     ) -> dict[tuple[str, str], list]:
         groups: dict[tuple[str, str], list] = defaultdict(list)
-        for component_type in component_types:
-            for component in self.system.get_components(component_type):
-                substation_name, feeder_name = self._get_component_group(component)
-                group_key = (
-                    substation_name if separate_substations else "all_substations",
-                    feeder_name if separate_feeders else "all_feeders",
-                )
-                groups[group_key].append(component)
+        components = chain.from_iterable(
+            self.system.get_components(component_type) for component_type in component_types
+        )
+        if not (separate_substations or separate_feeders):
+            # Everything lands in one group; skip the per-component substation/feeder lookups.
+            all_components = list(components)
+            if all_components:
+                groups[("all_substations", "all_feeders")] = all_components
+            return groups
+
+        for component in components:
+            substation_name, feeder_name = self._get_component_group(component)
+            group_key = (
+                substation_name if separate_substations else "all_substations",
+                feeder_name if separate_feeders else "all_feeders",
+            )
+            groups[group_key].append(component)
         return groups
 
     @staticmethod
@@ -464,7 +725,7 @@ class Writer(AbstractWriter):
     ) -> None:
         ET.SubElement(
             manifest,
-            "cim:File",
+            f"{{{CIM_NS}}}File",
             attrib={
                 "substation": substation_name,
                 "feeder": feeder_name,
@@ -474,23 +735,20 @@ class Writer(AbstractWriter):
         )
 
     def _write_single_output(self, output_path: Path, component_types: list[type]) -> None:
-        root = self._build_root()
         components = self._collect_components(component_types)
-        self._populate_core_graph(root, components)
-        self._write_xml(root, output_path / "model.xml")
+        self._stream_xml(components, output_path / "model.xml")
 
-    def _write_combined_package_file(
+    def _add_combined_package_file(
         self,
         manifest: ET.Element,
+        pending_files: list[tuple[list, Path]],
         folder: Path,
         substation_name: str,
         feeder_name: str,
         components: list,
     ) -> None:
         file_name = f"{substation_name}__{feeder_name}.xml"
-        root = self._build_root()
-        self._populate_core_graph(root, components)
-        self._write_xml(root, folder / file_name)
+        pending_files.append((components, folder / file_name))
         self._add_manifest_file_entry(
             manifest,
             substation_name,
@@ -499,33 +757,25 @@ class Writer(AbstractWriter):
             Path(substation_name) / feeder_name / file_name,
         )
 
-    def _write_split_package_files(
+    def _add_split_package_files(
         self,
         manifest: ET.Element,
+        pending_files: list[tuple[list, Path]],
         folder: Path,
         substation_name: str,
         feeder_name: str,
         components: list,
     ) -> None:
-        buses = [
-            component
-            for component in components
-            if component.__class__.__name__ == "DistributionBus"
-        ]
-        component_buckets: dict[str, list] = defaultdict(list)
-        for component in components:
-            component_key = self._component_type_key(component)
-            if component_key is None:
-                continue
-            component_buckets[component_key].append(component)
+        components_by_name = self._components_by_name(components)
+        buses = components_by_name.get("DistributionBus", [])
 
-        for component_key, bucket_components in component_buckets.items():
+        for component_key, bucket_components in components_by_name.items():
+            if component_key not in self._SUPPORTED_COMPONENT_TYPES:
+                continue
             file_components = self._combine_with_required_buses(bucket_components, buses)
             file_suffix = self._camel_to_snake(component_key)
             file_name = f"{substation_name}__{feeder_name}__{file_suffix}.xml"
-            root = self._build_root()
-            self._populate_core_graph(root, file_components)
-            self._write_xml(root, folder / file_name)
+            pending_files.append((file_components, folder / file_name))
 
             self._add_manifest_file_entry(
                 manifest,
@@ -535,6 +785,33 @@ class Writer(AbstractWriter):
                 Path(substation_name) / feeder_name / file_name,
             )
 
+    def _stream_package_files(
+        self, pending_files: list[tuple[list, Path]], max_workers: int | None
+    ) -> None:
+        """Write package files, fanning them out to forked worker processes when allowed.
+
+        Each file is emitted from scratch with deterministic ids, so worker output is identical
+        to the serial path. ``max_workers=None`` uses one worker per CPU. Workers are only
+        forked on Linux; forking is unsafe on macOS, so ``max_workers`` has no effect off Linux
+        and files are always written serially there.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        workers = min(max_workers, len(pending_files))
+        if workers <= 1 or sys.platform != "linux":
+            for components, output_file in pending_files:
+                self._stream_xml(components, output_file)
+            return
+
+        writes = [(self, components, path) for components, path in pending_files]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_forked_worker,
+            initargs=(writes,),
+        ) as pool:
+            list(pool.map(_stream_forked_write, range(len(writes))))
+
     def write(
         self,
         output_path: Path = Path("./"),
@@ -542,6 +819,7 @@ class Writer(AbstractWriter):
         separate_substations: bool = True,
         separate_feeders: bool = True,
         separate_equipment_types: bool = True,
+        max_workers: int | None = 1,
     ) -> None:
         output_path = Path(output_path)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -561,23 +839,20 @@ class Writer(AbstractWriter):
             component_types, separate_substations, separate_feeders
         )
 
-        manifest = ET.Element(
-            "PackageManifest",
-            attrib={
-                "xmlns:cim": "http://iec.ch/TC57/CIM100#",
-            },
-        )
+        manifest = ET.Element("PackageManifest", nsmap={"cim": CIM_NS})
+        pending_files: list[tuple[list, Path]] = []
         for (substation_name, feeder_name), components in groups.items():
             folder = output_path / substation_name / feeder_name
 
             if not separate_equipment_types:
-                self._write_combined_package_file(
-                    manifest, folder, substation_name, feeder_name, components
+                self._add_combined_package_file(
+                    manifest, pending_files, folder, substation_name, feeder_name, components
                 )
                 continue
 
-            self._write_split_package_files(
-                manifest, folder, substation_name, feeder_name, components
+            self._add_split_package_files(
+                manifest, pending_files, folder, substation_name, feeder_name, components
             )
 
+        self._stream_package_files(pending_files, max_workers)
         self._write_xml(manifest, output_path / "manifest.xml")
@@ -19,11 +19,10 @@ class DistributionBranchMapper(OpenDSSMapper):
         self.opendss_dict["Name"] = self.get_opendss_safe_name(self.model.name)
 
     def map_buses(self):
-        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(self.model.buses[0].name)
-        self.opendss_dict["Bus2"] = self.get_opendss_safe_name(self.model.buses[1].name)
-        for phase in self.model.phases:
-            self.opendss_dict["Bus1"] += self.phase_map[phase]
-            self.opendss_dict["Bus2"] += self.phase_map[phase]
+        dss_phases = "".join(self.phase_map[phase] for phase in self.model.phases)
+        bus_1, bus_2 = self.model.buses[0], self.model.buses[1]
+        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(bus_1.name) + dss_phases
+        self.opendss_dict["Bus2"] = self.get_opendss_safe_name(bus_2.name) + dss_phases
 
     def map_length(self):
         self.opendss_dict["Length"] = self.model.length.magnitude
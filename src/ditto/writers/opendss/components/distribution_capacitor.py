@@ -23,12 +23,11 @@ class DistributionCapacitorMapper(OpenDSSMapper):
         self.opendss_dict["Name"] = self.get_opendss_safe_name(self.model.name)
 
     def map_bus(self):
-        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(self.model.bus.name)
+        dss_phases = "".join(self.phase_map[phase] for phase in self.model.phases)
+        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(self.model.bus.name) + dss_phases
         num_phases = len(self.model.phases)
-        for phase in self.model.phases:
-            self.opendss_dict["Bus1"] += self.phase_map[phase]
         # TODO: Should we include the phases its connected to here?
-        nom_voltage = self.model.bus.rated_voltage.to("kV").magnitude
+        nom_voltage = self.model.bus.rated_voltage.m_as("kV")
         self.opendss_dict["kV"] = (
             nom_voltage if num_phases == 1 else nom_voltage * LL_LN_CONVERSION_FACTOR
         )
@@ -59,10 +58,10 @@ class DistributionCapacitorMapper(OpenDSSMapper):
         num_banks = None
         for phase_capacitor in equipment.phase_capacitors:
             num_banks = phase_capacitor.num_banks
-            total_resistance.append(phase_capacitor.resistance.to("ohm").magnitude)
-            total_reactance.append(phase_capacitor.reactance.to("ohm").magnitude)
+            total_resistance.append(phase_capacitor.resistance.m_as("ohm"))
+            total_reactance.append(phase_capacitor.reactance.m_as("ohm"))
             total_rated_reactive_power.append(
-                phase_capacitor.rated_reactive_power.to("kvar").magnitude
+                phase_capacitor.rated_reactive_power.m_as("kvar")
             )  # from general capacitor equipment
         self.opendss_dict["R"] = [sum(total_resistance) / num_banks] * num_banks
         self.opendss_dict["XL"] = [sum(total_reactance) / num_banks] * num_banks
@@ -42,12 +42,13 @@ class DistributionLoadMapper(OpenDSSMapper):
             }
             self.opendss_dict["Bus1"] += phase_map.get(phase.name, self.phase_map[phase])
         else:
-            for phase in self.model.phases:
-                self.opendss_dict["Bus1"] += self.phase_map[phase]
+            self.opendss_dict["Bus1"] += "".join(
+                self.phase_map[phase] for phase in self.model.phases
+            )
 
         # TODO: Should we include the phases its connected to here?
 
-        nom_voltage = self.model.bus.rated_voltage.to("kV").magnitude
+        nom_voltage = self.model.bus.rated_voltage.m_as("kV")
         voltage_type = self.model.bus.voltage_type
 
         nom_voltage = (
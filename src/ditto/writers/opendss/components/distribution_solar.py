@@ -27,11 +27,10 @@ class DistributionSolarMapper(OpenDSSMapper):
 
     def map_bus(self):
         num_phases = len(self.model.phases)
-        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(self.model.bus.name)
-        for phase in self.model.phases:
-            self.opendss_dict["Bus1"] += self.phase_map[phase]
+        dss_phases = "".join(self.phase_map[phase] for phase in self.model.phases)
+        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(self.model.bus.name) + dss_phases
         # TODO: Should we include the phases its connected to here?
-        nom_voltage = self.model.bus.rated_voltage.to("kV").magnitude
+        nom_voltage = self.model.bus.rated_voltage.m_as("kV")
         self.opendss_dict["kV"] = (
             nom_voltage if num_phases == 1 else nom_voltage * LL_LN_CONVERSION_FACTOR
         )
@@ -40,13 +39,13 @@ class DistributionSolarMapper(OpenDSSMapper):
         self.opendss_dict["Phases"] = len(self.model.phases)
 
     def map_irradiance(self):
-        self.opendss_dict["Irradiance"] = self.model.irradiance.to("kilowatt / meter**2").magnitude
+        self.opendss_dict["Irradiance"] = self.model.irradiance.m_as("kilowatt / meter**2")
 
     def map_active_power(self):
         ...
 
     def map_reactive_power(self):
-        self.opendss_dict["kvar"] = self.model.reactive_power.to("kilovar").magnitude
+        self.opendss_dict["kvar"] = self.model.reactive_power.m_as("kilovar")
 
     def map_controller(self):
         ...
@@ -58,9 +57,10 @@ class DistributionSolarMapper(OpenDSSMapper):
     def map_equipment(self):
         equipment = self.model.equipment
         inverter = self.model.inverter
-        self.opendss_dict["Pmpp"] = equipment.rated_power.to("kilowatt").magnitude
-        self.opendss_dict["kVA"] = inverter.rated_apparent_power.to("kilova").magnitude
-        self.opendss_dict["kvarMaxAbs"] = inverter.rated_apparent_power.to("kilova").magnitude
+        self.opendss_dict["Pmpp"] = equipment.rated_power.m_as("kilowatt")
+        rated_kva = inverter.rated_apparent_power.m_as("kilova")
+        self.opendss_dict["kVA"] = rated_kva
+        self.opendss_dict["kvarMaxAbs"] = rated_kva
         self.opendss_dict["pctR"] = equipment.resistance
         self.opendss_dict["pctX"] = equipment.reactance
         self.opendss_dict["pctPmpp"] = inverter.dc_to_ac_efficiency
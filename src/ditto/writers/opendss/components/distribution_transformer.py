@@ -29,10 +29,7 @@ class DistributionTransformerMapper(OpenDSSMapper):
             for i in range(len(self.model.buses)):
                 bus = self.model.buses[i]
                 buses.append(self.get_opendss_safe_name(bus.name))
-            dss_phases = ""
-            for phase in self.model.winding_phases[0]:
-                dss_phases += self.phase_map[phase]
-            phases.append(dss_phases)
+            phases.append("".join(self.phase_map[phase] for phase in self.model.winding_phases[0]))
             phases.append(".1.0")
             phases.append(".0.2")
 
@@ -40,10 +37,7 @@ class DistributionTransformerMapper(OpenDSSMapper):
             for bus in self.model.buses:
                 buses.append(self.get_opendss_safe_name(bus.name))
             for winding_phases in self.model.winding_phases:
-                dss_phases = ""
-                for phase in winding_phases:
-                    dss_phases += self.phase_map[phase]
-                phases.append(dss_phases)
+                phases.append("".join(self.phase_map[phase] for phase in winding_phases))
 
         for i in range(len(buses)):
             buses_and_phases.append(buses[i] + phases[i])
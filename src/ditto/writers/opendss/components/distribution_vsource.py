@@ -27,9 +27,8 @@ class DistributionVoltageSourceMapper(OpenDSSMapper):
             self.opendss_dict["Yearly"] = profile_name
 
     def map_bus(self):
-        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(self.model.bus.name)
-        for phase in self.model.phases:
-            self.opendss_dict["Bus1"] += self.phase_map[phase]
+        dss_phases = "".join(self.phase_map[phase] for phase in self.model.phases)
+        self.opendss_dict["Bus1"] = self.get_opendss_safe_name(self.model.bus.name) + dss_phases
 
     def map_phases(self):
         # Handled in the map_bus function
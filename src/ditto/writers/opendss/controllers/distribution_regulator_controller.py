@@ -24,16 +24,16 @@ class RegulatorControllerMapper(OpenDSSMapper):
         self.opendss_dict["Winding"] = self.model.tapped_winding
 
     def map_delay(self):
-        self.opendss_dict["TapDelay"] = self.model.delay.to("s").magnitude
+        self.opendss_dict["TapDelay"] = self.model.delay.m_as("s")
 
     def map_v_setpoint(self):
-        self.opendss_dict["VReg"] = self.model.v_setpoint.to("volts").magnitude
+        self.opendss_dict["VReg"] = self.model.v_setpoint.m_as("volts")
 
     def map_min_v_limit(self):
-        self.opendss_dict["VMinLimit"] = self.model.min_v_limit.to("volts").magnitude
+        self.opendss_dict["VMinLimit"] = self.model.min_v_limit.m_as("volts")
 
     def map_max_v_limit(self):
-        self.opendss_dict["VMaxLimit"] = self.model.max_v_limit.to("volts").magnitude
+        self.opendss_dict["VMaxLimit"] = self.model.max_v_limit.m_as("volts")
 
     def map_pt_ratio(self):
         self.opendss_dict["PTRatio"] = self.model.pt_ratio
@@ -45,19 +45,19 @@ class RegulatorControllerMapper(OpenDSSMapper):
         self.opendss_dict["Reversible"] = self.model.is_reversible
 
     def map_ldc_R(self):
-        self.opendss_dict["R"] = self.model.ldc_R.to("volts").magnitude
+        self.opendss_dict["R"] = self.model.ldc_R.m_as("volts")
 
     def map_ldc_X(self):
-        self.opendss_dict["X"] = self.model.ldc_X.to("volts").magnitude
+        self.opendss_dict["X"] = self.model.ldc_X.m_as("volts")
 
     def map_ct_primary(self):
-        self.opendss_dict["CTPrim"] = self.model.ct_primary.to("ampere").magnitude
+        self.opendss_dict["CTPrim"] = self.model.ct_primary.m_as("ampere")
 
     def map_max_step(self):
         self.opendss_dict["MaxTapChange"] = self.model.max_step
 
     def map_bandwidth(self):
-        self.opendss_dict["Band"] = self.model.bandwidth.to("volts").magnitude
+        self.opendss_dict["Band"] = self.model.bandwidth.m_as("volts")
 
     def map_controlled_bus(self):
         self.opendss_dict[
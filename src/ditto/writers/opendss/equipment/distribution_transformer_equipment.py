@@ -44,7 +44,7 @@ class DistributionTransformerEquipmentMapper(OpenDSSMapper):
 
             num_phases = winding.num_phases
             # rated_voltage
-            nom_voltage = winding.rated_voltage.to("kV").magnitude
+            nom_voltage = winding.rated_voltage.m_as("kV")
             voltage_type = winding.voltage_type
             connection_type = winding.connection_type
             nom_voltage_LN = (
@@ -60,7 +60,7 @@ class DistributionTransformerEquipmentMapper(OpenDSSMapper):
             # resistance
             pctRs.append(winding.resistance)
             # rated_power
-            kVAs.append(winding.rated_power.to("kilova").magnitude)
+            kVAs.append(winding.rated_power.m_as("kilova"))
             # connection_type
             conns.append(self.connection_map[connection_type])
             # TODO: num_phases and is_grounded aren't included
@@ -73,7 +73,7 @@ class DistributionTransformerEquipmentMapper(OpenDSSMapper):
             ):
                 kvs.append(nom_voltage)
                 pctRs.append(winding.resistance)
-                kVAs.append(winding.rated_power.to("kilova").magnitude)
+                kVAs.append(winding.rated_power.m_as("kilova"))
                 conns.append(self.connection_map[winding.connection_type])
                 taps.append(tap_pu[0])
                 min_tap.append(winding.min_tap_pu)
@@ -190,9 +190,9 @@ class Writer(AbstractWriter):
         buses: list[DistributionBus] = list(self.system.get_components(DistributionBus))
         for bus in buses:
             voltage_bases.append(
-                bus.rated_voltage.to("kilovolt").magnitude
+                bus.rated_voltage.m_as("kilovolt")
                 if bus.voltage_type == "line-to-line"
-                else bus.rated_voltage.to("kilovolt").magnitude * LL_LN_CONVERSION_FACTOR
+                else bus.rated_voltage.m_as("kilovolt") * LL_LN_CONVERSION_FACTOR
             )
         return list(set(voltage_bases))
 
@@ -1,6 +1,36 @@
+from pathlib import Path
+
 import pytest
 
+from tests.helpers import get_metrics
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked as slow"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: large-model test, skipped unless --runslow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 @pytest.fixture(scope="session")
 def fixed_tmp_path(tmp_path_factory):
     return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="session")
+def ieee13_reference_metrics():
+    return get_metrics(
+        Path(__file__).parent / "data" / "opendss_circuit_models" / "ieee13" / "Master.dss"
+    )
@@ -1,8 +1,29 @@
 from pathlib import Path
 
 import pytest
+from gdm.distribution import DistributionSystem
 
+from ditto.readers.cim_iec_61968_13.reader import Reader as CimReader
+from ditto.readers.opendss.reader import Reader as OpenDSSReader
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def ieee13_node_xml_file():
     return Path(__file__).parent.parent / "data" / "cim_iec_61968_13" / "IEEE13Nodeckt_CIM100x.XML"
+
+
+@pytest.fixture(scope="session")
+def ieee13_cim_system(ieee13_node_xml_file) -> DistributionSystem:
+    """IEEE 13-node system read from CIM once per session; tests must not mutate it."""
+    reader = CimReader(ieee13_node_xml_file)
+    reader.read()
+    return reader.get_system()
+
+
+@pytest.fixture(scope="session")
+def ieee13_opendss_system() -> DistributionSystem:
+    """IEEE 13-node system read from OpenDSS once per session; tests must not mutate it."""
+    master_file = (
+        Path(__file__).parent.parent / "data" / "opendss_circuit_models" / "ieee13" / "Master.dss"
+    )
+    return OpenDSSReader(master_file).get_system()
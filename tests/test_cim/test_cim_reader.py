@@ -1,23 +1,39 @@
-from pathlib import Path
-
 import numpy as np
+import pytest
+from gdm.distribution.components import MatrixImpedanceBranch
 
 from ditto.readers.cim_iec_61968_13.reader import Reader
 from ditto.writers.opendss.write import Writer
 from tests.helpers import get_metrics
 
 
-def test_cim_to_opendss_roundtrip(ieee13_node_xml_file, tmp_path):
-    ieee13_node_dss_file = (
-        Path(__file__).parent.parent / "data" / "opendss_circuit_models" / "ieee13" / "Master.dss"
-    )
-    pre_converion_metrics = get_metrics(ieee13_node_dss_file)
+def test_cim_to_opendss_roundtrip(ieee13_node_xml_file, tmp_path, ieee13_reference_metrics):
     cim_reader = Reader(ieee13_node_xml_file)
     cim_reader.read()
     system = cim_reader.get_system()
     writer = Writer(system)
     writer.write(output_path=tmp_path, separate_substations=False, separate_feeders=False)
     post_converion_metrics = get_metrics(tmp_path / "Master.dss")
-    assert np.allclose(
-        pre_converion_metrics, post_converion_metrics, rtol=0.01, atol=0.01
-    ), "Round trip coversion exceeds error tolerance"
+    within_tolerance = np.isclose(
+        ieee13_reference_metrics, post_converion_metrics, rtol=0.01, atol=0.01
+    )
+    mismatched = np.flatnonzero(~within_tolerance)
+    assert mismatched.size == 0, (
+        f"Round trip coversion exceeds error tolerance at metrics {mismatched.tolist()}, "
+        f"\npre: {np.take(ieee13_reference_metrics, mismatched)}, "
+        f"\npost: {np.take(post_converion_metrics, mismatched)}"
+    )
+
+
+def test_cim_reader_oxigraph_store_matches_default(ieee13_node_xml_file):
+    pytest.importorskip("oxrdflib")
+
+    def branch_buses(store):
+        reader = Reader(ieee13_node_xml_file, store=store)
+        reader.read()
+        return {
+            branch.name: [bus.name for bus in branch.buses]
+            for branch in reader.get_system().get_components(MatrixImpedanceBranch)
+        }
+
+    assert branch_buses("Oxigraph") == branch_buses("default")
@@ -10,8 +10,12 @@ Known limitations
   to parse them back. They are excluded from roundtrip checks.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+import sys
 
+import numpy as np
 import pytest
 
 from gdm.distribution import DistributionSystem
@@ -61,16 +65,102 @@ ROUNDTRIP_COMPONENT_TYPES = [
 ]
 
 
+def _count_components(system: DistributionSystem, component_type) -> int:
+    """Count components of a type without materializing them in a list."""
+    return sum(1 for _ in system.get_components(component_type))
+
+
+def _partition(system: DistributionSystem) -> dict[type, list]:
+    """Bucket the roundtrip-safe components by concrete type in one pass over the system.
+
+    None of ``ROUNDTRIP_COMPONENT_TYPES`` has subclasses in gdm, so an exact type lookup
+    matches what ``get_components`` would return per type.
+    """
+    buckets = {cls: [] for cls in ROUNDTRIP_COMPONENT_TYPES}
+    for component in system.iter_all_components():
+        bucket = buckets.get(type(component))
+        if bucket is not None:
+            bucket.append(component)
+    return buckets
+
+
 def _get_component_counts(system: DistributionSystem) -> dict[str, int]:
     """Return {type_name: count} for all roundtrip-safe component types."""
-    return {
-        cls.__name__: len(list(system.get_components(cls))) for cls in ROUNDTRIP_COMPONENT_TYPES
-    }
+    return {cls.__name__: len(components) for cls, components in _partition(system).items()}
 
 
-def _get_component_names(system: DistributionSystem, component_type) -> set[str]:
-    """Return the set of component names for a given type."""
-    return {c.name for c in system.get_components(component_type)}
+def _canonical_name(name: str) -> str:
+    """Case-insensitive key used for every name comparison in this module.
+
+    Interned because the same bus names recur across the load, line and switch maps.
+    """
+    return sys.intern(name.lower())
+
+
+@dataclass(frozen=True)
+class _SystemIndex:
+    """Lower-cased name lookups used by the attribute-preservation tests."""
+
+    bus_volts: dict[str, float]
+    line_lengths_m: dict[str, float]
+    load_buses: dict[str, str]
+    line_buses: dict[str, tuple[str, ...]]
+    switch_buses: dict[str, tuple[str, ...]]
+    names_by_type: dict[type, frozenset[str]]
+
+
+@lru_cache(maxsize=None)
+def _index(system: DistributionSystem) -> _SystemIndex:
+    """Traverse ``system`` and convert units once, however many tests compare it."""
+    return _SystemIndex(
+        bus_volts={
+            _canonical_name(bus.name): bus.rated_voltage.m_as("volt")
+            for bus in system.get_components(DistributionBus)
+        },
+        line_lengths_m={
+            _canonical_name(line.name): line.length.m_as("meter")
+            for line in system.get_components(MatrixImpedanceBranch)
+        },
+        load_buses={
+            _canonical_name(load.name): _canonical_name(load.bus.name)
+            for load in system.get_components(DistributionLoad)
+        },
+        line_buses={
+            _canonical_name(line.name): tuple(
+                sorted(_canonical_name(bus.name) for bus in line.buses)
+            )
+            for line in system.get_components(MatrixImpedanceBranch)
+        },
+        switch_buses={
+            _canonical_name(switch.name): tuple(
+                sorted(_canonical_name(bus.name) for bus in switch.buses)
+            )
+            for switch in system.get_components(MatrixImpedanceSwitch)
+        },
+        names_by_type={
+            cls: frozenset(_canonical_name(component.name) for component in components)
+            for cls, components in _partition(system).items()
+        },
+    )
+
+
+def _assert_values_close(
+    original: dict[str, float],
+    roundtripped: dict[str, float],
+    tolerance: float,
+    skip_missing: bool = False,
+) -> None:
+    """Compare name-aligned values in one vectorized pass and name any that drifted.
+
+    Names absent from ``original`` fail with a ``KeyError`` unless ``skip_missing`` is set.
+    """
+    names = [name for name in roundtripped if not skip_missing or name in original]
+    rt_values = np.fromiter((roundtripped[name] for name in names), float, len(names))
+    orig_values = np.fromiter((original[name] for name in names), float, len(names))
+    drifted = np.flatnonzero(~(np.abs(rt_values - orig_values) < tolerance))
+    assert drifted.size == 0, ", ".join(
+        f"{names[i]}: {rt_values[i]} != {orig_values[i]}" for i in drifted
+    )
 
 
 def _cim_roundtrip(system: DistributionSystem, tmp_path: Path) -> DistributionSystem:
@@ -278,43 +368,37 @@ class TestSyntheticCimRoundtrip:
     voltages for transformer-connected buses (see module docstring).
     """
 
-    @pytest.fixture()
-    def original_system(self) -> DistributionSystem:
+    # The tests only read these systems, so one build and one roundtrip serve the whole class.
+    @pytest.fixture(scope="class")
+    @classmethod
+    def original_system(cls) -> DistributionSystem:
         return _build_synthetic_system()
 
-    @pytest.fixture()
-    def roundtripped_system(self, original_system, tmp_path) -> DistributionSystem:
-        return _cim_roundtrip(original_system, tmp_path)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def roundtripped_system(cls, original_system, tmp_path_factory) -> DistributionSystem:
+        return _cim_roundtrip(original_system, tmp_path_factory.mktemp("synthetic_roundtrip"))
 
     def test_bus_count_preserved(self, original_system, roundtripped_system):
-        orig = len(list(original_system.get_components(DistributionBus)))
-        rt = len(list(roundtripped_system.get_components(DistributionBus)))
+        orig = _count_components(original_system, DistributionBus)
+        rt = _count_components(roundtripped_system, DistributionBus)
         assert rt == orig
 
     def test_bus_names_preserved(self, original_system, roundtripped_system):
-        orig_names = _get_component_names(original_system, DistributionBus)
-        rt_names = _get_component_names(roundtripped_system, DistributionBus)
-        assert {n.lower() for n in orig_names} == {n.lower() for n in rt_names}
+        orig_names = _index(original_system).names_by_type[DistributionBus]
+        rt_names = _index(roundtripped_system).names_by_type[DistributionBus]
+        assert orig_names == rt_names
 
     def test_bus_voltages_preserved(self, original_system, roundtripped_system):
-        orig_buses = {
-            b.name.lower(): b.rated_voltage
-            for b in original_system.get_components(DistributionBus)
-        }
-        for bus in roundtripped_system.get_components(DistributionBus):
-            orig = orig_buses[bus.name.lower()]
-            # Convert both to the same unit for comparison
-            orig_volts = orig.to("volt").magnitude
-            rt_volts = bus.rated_voltage.to("volt").magnitude
-            assert (
-                abs(rt_volts - orig_volts) < 1.0
-            ), f"Bus {bus.name}: {bus.rated_voltage} != {orig}"
+        _assert_values_close(
+            _index(original_system).bus_volts, _index(roundtripped_system).bus_volts, 1.0
+        )
 
     def test_voltage_source_preserved(self, original_system, roundtripped_system):
         orig = list(original_system.get_components(DistributionVoltageSource))
         rt = list(roundtripped_system.get_components(DistributionVoltageSource))
         assert len(rt) == len(orig)
-        assert rt[0].name.lower() == orig[0].name.lower()
+        assert _canonical_name(rt[0].name) == _canonical_name(orig[0].name)
 
     def test_load_names_preserved(self, original_system, roundtripped_system):
         """Load names survive roundtrip.
@@ -323,43 +407,38 @@ class TestSyntheticCimRoundtrip:
         so the roundtripped system may have more load objects (one per original
         phase) than the original. We check that every original name appears.
         """
-        orig_names = {ld.name.lower() for ld in original_system.get_components(DistributionLoad)}
-        rt_names = {ld.name.lower() for ld in roundtripped_system.get_components(DistributionLoad)}
+        orig_names = _index(original_system).names_by_type[DistributionLoad]
+        rt_names = _index(roundtripped_system).names_by_type[DistributionLoad]
         assert orig_names <= rt_names or orig_names == rt_names
 
     def test_load_bus_assignment_preserved(self, original_system, roundtripped_system):
         """Loads remain on the same bus (checked by name match)."""
-        orig_bus_map = {
-            ld.name.lower(): ld.bus.name.lower()
-            for ld in original_system.get_components(DistributionLoad)
-        }
-        for ld in roundtripped_system.get_components(DistributionLoad):
-            orig_bus = orig_bus_map.get(ld.name.lower())
+        orig_bus_map = _index(original_system).load_buses
+        for name, bus in _index(roundtripped_system).load_buses.items():
+            orig_bus = orig_bus_map.get(name)
             if orig_bus is not None:
-                assert ld.bus.name.lower() == orig_bus
+                assert bus == orig_bus
 
     def test_line_count_and_name_preserved(self, original_system, roundtripped_system):
-        orig = list(original_system.get_components(MatrixImpedanceBranch))
-        rt = list(roundtripped_system.get_components(MatrixImpedanceBranch))
-        assert len(rt) == len(orig)
-        assert {ln.name.lower() for ln in rt} == {ln.name.lower() for ln in orig}
+        orig = _count_components(original_system, MatrixImpedanceBranch)
+        rt = _count_components(roundtripped_system, MatrixImpedanceBranch)
+        assert rt == orig
+        assert (
+            _index(roundtripped_system).names_by_type[MatrixImpedanceBranch]
+            == _index(original_system).names_by_type[MatrixImpedanceBranch]
+        )
 
     def test_line_bus_connections_preserved(self, original_system, roundtripped_system):
-        orig_lines = {
-            ln.name.lower(): tuple(sorted(b.name.lower() for b in ln.buses))
-            for ln in original_system.get_components(MatrixImpedanceBranch)
-        }
-        for ln in roundtripped_system.get_components(MatrixImpedanceBranch):
-            assert tuple(sorted(b.name.lower() for b in ln.buses)) == orig_lines[ln.name.lower()]
+        orig_lines = _index(original_system).line_buses
+        for name, buses in _index(roundtripped_system).line_buses.items():
+            assert buses == orig_lines[name]
 
     def test_line_length_preserved(self, original_system, roundtripped_system):
-        orig_lines = {
-            ln.name.lower(): ln.length.to("meter").magnitude
-            for ln in original_system.get_components(MatrixImpedanceBranch)
-        }
-        for ln in roundtripped_system.get_components(MatrixImpedanceBranch):
-            rt_m = ln.length.to("meter").magnitude
-            assert abs(rt_m - orig_lines[ln.name.lower()]) < 1.0
+        _assert_values_close(
+            _index(original_system).line_lengths_m,
+            _index(roundtripped_system).line_lengths_m,
+            1.0,
+        )
 
     def test_capacitor_names_preserved(self, original_system, roundtripped_system):
         """Capacitor names survive roundtrip.
@@ -367,27 +446,23 @@ class TestSyntheticCimRoundtrip:
         Like loads, the CIM writer may split a multi-phase capacitor into
         per-phase LinearShuntCompensators, so the count may increase.
         """
-        orig_names = {
-            c.name.lower() for c in original_system.get_components(DistributionCapacitor)
-        }
-        rt_names = {
-            c.name.lower() for c in roundtripped_system.get_components(DistributionCapacitor)
-        }
+        orig_names = _index(original_system).names_by_type[DistributionCapacitor]
+        rt_names = _index(roundtripped_system).names_by_type[DistributionCapacitor]
         assert orig_names <= rt_names or orig_names == rt_names
 
     def test_switch_count_and_name_preserved(self, original_system, roundtripped_system):
-        orig = list(original_system.get_components(MatrixImpedanceSwitch))
-        rt = list(roundtripped_system.get_components(MatrixImpedanceSwitch))
-        assert len(rt) == len(orig)
-        assert {s.name.lower() for s in rt} == {s.name.lower() for s in orig}
+        orig = _count_components(original_system, MatrixImpedanceSwitch)
+        rt = _count_components(roundtripped_system, MatrixImpedanceSwitch)
+        assert rt == orig
+        assert (
+            _index(roundtripped_system).names_by_type[MatrixImpedanceSwitch]
+            == _index(original_system).names_by_type[MatrixImpedanceSwitch]
+        )
 
     def test_switch_bus_connections_preserved(self, original_system, roundtripped_system):
-        orig_sw = {
-            sw.name.lower(): tuple(sorted(b.name.lower() for b in sw.buses))
-            for sw in original_system.get_components(MatrixImpedanceSwitch)
-        }
-        for sw in roundtripped_system.get_components(MatrixImpedanceSwitch):
-            assert tuple(sorted(b.name.lower() for b in sw.buses)) == orig_sw[sw.name.lower()]
+        orig_sw = _index(original_system).switch_buses
+        for name, buses in _index(roundtripped_system).switch_buses.items():
+            assert buses == orig_sw[name]
 
 
 # ---------------------------------------------------------------------------
@@ -398,17 +473,17 @@ class TestSyntheticCimRoundtrip:
 class TestCimRoundtripIEEE13:
     """Full roundtrip tests using the IEEE 13-node CIM XML fixture."""
 
-    @pytest.fixture()
-    def original_system(self, ieee13_node_xml_file) -> DistributionSystem:
-        reader = CimReader(ieee13_node_xml_file)
-        reader.read()
-        return reader.get_system()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def original_system(cls, ieee13_cim_system) -> DistributionSystem:
+        return ieee13_cim_system
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
+    @classmethod
     def roundtripped_system(
-        self, original_system: DistributionSystem, tmp_path
+        cls, original_system: DistributionSystem, tmp_path_factory
     ) -> DistributionSystem:
-        return _cim_roundtrip(original_system, tmp_path)
+        return _cim_roundtrip(original_system, tmp_path_factory.mktemp("ieee13_cim_roundtrip"))
 
     def test_component_counts_are_preserved(self, original_system, roundtripped_system):
         """Every supported component type retains the same count.
@@ -440,45 +515,35 @@ class TestCimRoundtripIEEE13:
         self, original_system, roundtripped_system, component_type
     ):
         """Component names survive the roundtrip (case-insensitive)."""
-        original_names = {n.lower() for n in _get_component_names(original_system, component_type)}
-        roundtripped_names = {
-            n.lower() for n in _get_component_names(roundtripped_system, component_type)
-        }
-        missing = original_names - roundtripped_names
+        missing = (
+            _index(original_system).names_by_type[component_type]
+            - _index(roundtripped_system).names_by_type[component_type]
+        )
         assert not missing, f"{component_type.__name__}: names lost in roundtrip: {missing}"
 
     def test_bus_rated_voltages_preserved(self, original_system, roundtripped_system):
-        orig_buses = {
-            b.name.lower(): b.rated_voltage
-            for b in original_system.get_components(DistributionBus)
-        }
-        for bus in roundtripped_system.get_components(DistributionBus):
-            orig = orig_buses.get(bus.name.lower())
-            if orig is None:
-                continue
-            assert abs(bus.rated_voltage.to("volt").magnitude - orig.to("volt").magnitude) < 1.0
+        _assert_values_close(
+            _index(original_system).bus_volts,
+            _index(roundtripped_system).bus_volts,
+            1.0,
+            skip_missing=True,
+        )
 
     def test_line_lengths_preserved(self, original_system, roundtripped_system):
-        orig_lines = {
-            ln.name.lower(): ln.length
-            for ln in original_system.get_components(MatrixImpedanceBranch)
-        }
-        for ln in roundtripped_system.get_components(MatrixImpedanceBranch):
-            orig = orig_lines.get(ln.name.lower())
-            if orig is None:
-                continue
-            assert abs(ln.length.to("meter").magnitude - orig.to("meter").magnitude) < 1.0
+        _assert_values_close(
+            _index(original_system).line_lengths_m,
+            _index(roundtripped_system).line_lengths_m,
+            1.0,
+            skip_missing=True,
+        )
 
     def test_load_bus_assignments_preserved(self, original_system, roundtripped_system):
-        orig_loads = {
-            ld.name.lower(): ld.bus.name.lower()
-            for ld in original_system.get_components(DistributionLoad)
-        }
-        for ld in roundtripped_system.get_components(DistributionLoad):
-            orig_bus = orig_loads.get(ld.name.lower())
+        orig_loads = _index(original_system).load_buses
+        for name, bus in _index(roundtripped_system).load_buses.items():
+            orig_bus = orig_loads.get(name)
             if orig_bus is None:
                 continue
-            assert ld.bus.name.lower() == orig_bus
+            assert bus == orig_bus
 
 
 # ---------------------------------------------------------------------------
@@ -489,25 +554,17 @@ class TestCimRoundtripIEEE13:
 class TestOpenDSSToCimRoundtrip:
     """Read IEEE 13-node from OpenDSS, write CIM, read CIM back, compare."""
 
-    @pytest.fixture()
-    def opendss_system(self) -> DistributionSystem:
-        from ditto.readers.opendss.reader import Reader as OpenDSSReader
-
-        master_file = (
-            Path(__file__).parent.parent
-            / "data"
-            / "opendss_circuit_models"
-            / "ieee13"
-            / "Master.dss"
-        )
-        reader = OpenDSSReader(master_file)
-        return reader.get_system()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def opendss_system(cls, ieee13_opendss_system) -> DistributionSystem:
+        return ieee13_opendss_system
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
+    @classmethod
     def roundtripped_system(
-        self, opendss_system: DistributionSystem, tmp_path
+        cls, opendss_system: DistributionSystem, tmp_path_factory
     ) -> DistributionSystem:
-        return _cim_roundtrip(opendss_system, tmp_path)
+        return _cim_roundtrip(opendss_system, tmp_path_factory.mktemp("ieee13_opendss_roundtrip"))
 
     def test_component_counts_within_tolerance(self, opendss_system, roundtripped_system):
         """Component counts preserved or only slightly reduced."""
@@ -522,24 +579,22 @@ class TestOpenDSSToCimRoundtrip:
             assert loss_pct <= 1, f"{type_name}: lost {loss_pct:.0f}% ({expected} → {actual})"
 
     def test_buses_survive_roundtrip(self, opendss_system, roundtripped_system):
-        original_names = {b.name.lower() for b in opendss_system.get_components(DistributionBus)}
-        roundtripped_names = {
-            b.name.lower() for b in roundtripped_system.get_components(DistributionBus)
-        }
+        original_names = _index(opendss_system).names_by_type[DistributionBus]
+        roundtripped_names = _index(roundtripped_system).names_by_type[DistributionBus]
         missing = original_names - roundtripped_names
         loss_pct = len(missing) / len(original_names) * 100 if original_names else 0
         assert loss_pct <= 1, f"Lost {len(missing)}/{len(original_names)} buses"
 
     def test_loads_survive_roundtrip(self, opendss_system, roundtripped_system):
-        original = len(list(opendss_system.get_components(DistributionLoad)))
-        roundtripped = len(list(roundtripped_system.get_components(DistributionLoad)))
+        original = _count_components(opendss_system, DistributionLoad)
+        roundtripped = _count_components(roundtripped_system, DistributionLoad)
         if original > 0:
             loss_pct = (original - roundtripped) / original * 100
             assert loss_pct <= 1
 
     def test_lines_survive_roundtrip(self, opendss_system, roundtripped_system):
-        original = len(list(opendss_system.get_components(MatrixImpedanceBranch)))
-        roundtripped = len(list(roundtripped_system.get_components(MatrixImpedanceBranch)))
+        original = _count_components(opendss_system, MatrixImpedanceBranch)
+        roundtripped = _count_components(roundtripped_system, MatrixImpedanceBranch)
         if original > 0:
             loss_pct = (original - roundtripped) / original * 100
             assert loss_pct <= 1
@@ -1,13 +1,19 @@
+import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from defusedxml import ElementTree as ET
 
 import pytest
+from gdm.distribution import DistributionSystem
 from gdm.distribution.components import DistributionBattery, DistributionBus
 from gdm.distribution.equipment import BatteryEquipment, InverterEquipment
 from gdm.distribution.enums import Phase, VoltageTypes
 from gdm.quantities import ActivePower, ApparentPower, EnergyDC, ReactivePower, Voltage
 
 from ditto.readers.opendss.reader import Reader
+from ditto.writers.cim_iec_61968_13 import write as cim_write
 from ditto.writers.cim_iec_61968_13.write import Writer
 
 
@@ -23,46 +29,170 @@ _P4U_DT0_DSS = (
     / "Master.dss"
 )
 
+_CIM_NS = "{http://iec.ch/TC57/CIM100#}"
 
-def test_cim_writer_single_mode(tmp_path):
-    system = Reader(_IEEE13_DSS).get_system()
-    writer = Writer(system)
+
+def _top_level_tag_counts(xml_file: Path) -> Counter:
+    """Count the CIM objects (children of ``rdf:RDF``) in one streaming pass."""
+    counts = Counter()
+    depth = 0
+    for event, element in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2:
+                counts[element.tag] += 1
+        else:
+            depth -= 1
+            if depth == 1:
+                element.clear()
+    return counts
+
+
+def _package_name_blob(output_path: Path) -> str:
+    """Join every package file name so each assertion is one substring check."""
+    return "\n".join(path.name for path in output_path.rglob("*.xml"))
+
+
+@pytest.fixture(scope="module")
+def ieee13_writer(ieee13_opendss_system):
+    # Shared by the read-only mode tests so the writer's id and quantity caches carry over.
+    return Writer(ieee13_opendss_system)
+
+
+@pytest.fixture(scope="module")
+def ieee13_package_dir(tmp_path_factory, ieee13_writer) -> Path:
+    """Serial package output shared by the package-mode and parallel comparison tests."""
+    output_path = tmp_path_factory.mktemp("ieee13_package")
+    ieee13_writer.write(output_path=output_path, output_mode="package")
+    return output_path
+
+
+def test_cim_writer_single_mode(tmp_path, ieee13_writer):
+    writer = ieee13_writer
 
     writer.write(output_path=tmp_path, output_mode="single")
 
     output_file = tmp_path / "model.xml"
     assert output_file.exists()
 
-    tree = ET.parse(output_file)
-    root = tree.getroot()
-    assert root.tag.endswith("RDF")
+    # Only the root element is checked here; the serialization tests parse full documents.
+    with open(output_file, "rb") as file:
+        head = file.read(4096)
+    assert b"<rdf:RDF" in head
 
 
-def test_cim_writer_package_mode(tmp_path):
-    system = Reader(_IEEE13_DSS).get_system()
-    writer = Writer(system)
-
-    writer.write(output_path=tmp_path, output_mode="package")
-
-    manifest_file = tmp_path / "manifest.xml"
+def test_cim_writer_package_mode(ieee13_package_dir):
+    manifest_file = ieee13_package_dir / "manifest.xml"
     assert manifest_file.exists()
 
     manifest_tree = ET.parse(manifest_file)
     manifest_root = manifest_tree.getroot()
     assert manifest_root.tag == "PackageManifest"
 
-    package_files = list(tmp_path.rglob("*.xml"))
-    assert len(package_files) > 1
+    package_names = _package_name_blob(ieee13_package_dir)
+    assert len(package_names.splitlines()) > 1
 
-    package_names = [path.name for path in package_files]
-    assert any("distribution_bus" in name for name in package_names)
-    assert any("distribution_load" in name for name in package_names)
-    assert any("matrix_impedance_branch" in name for name in package_names)
+    assert "distribution_bus" in package_names
+    assert "distribution_load" in package_names
+    assert "matrix_impedance_branch" in package_names
 
 
-def test_cim_writer_invalid_mode(tmp_path):
-    system = Reader(_IEEE13_DSS).get_system()
+def test_cim_writer_streamed_output_matches_in_memory_tree(
+    tmp_path, monkeypatch, ieee13_opendss_system
+):
+    system = ieee13_opendss_system
     writer = Writer(system)
+    components = writer._collect_components(list(system.get_component_types()))
+
+    root = writer._build_root()
+    writer._populate_core_graph(root, components)
+    Writer._write_xml(root, tmp_path / "in_memory.xml")
+
+    monkeypatch.setattr(cim_write, "STREAM_FLUSH_ELEMENTS", 5)
+    writer._stream_xml(components, tmp_path / "streamed.xml")
+
+    assert (tmp_path / "streamed.xml").read_bytes() == (tmp_path / "in_memory.xml").read_bytes()
+
+
+@pytest.mark.parametrize("max_workers", [2, None])
+def test_cim_writer_parallel_package_matches_serial(
+    tmp_path, max_workers, ieee13_writer, ieee13_package_dir
+):
+    serial_dir = ieee13_package_dir
+    parallel_dir = tmp_path / "parallel"
+    ieee13_writer.write(output_path=parallel_dir, output_mode="package", max_workers=max_workers)
+
+    serial_files = sorted(path.relative_to(serial_dir) for path in serial_dir.rglob("*.xml"))
+    parallel_files = sorted(path.relative_to(parallel_dir) for path in parallel_dir.rglob("*.xml"))
+    assert serial_files == parallel_files
+    for relative_path in serial_files:
+        assert (parallel_dir / relative_path).read_bytes() == (
+            serial_dir / relative_path
+        ).read_bytes()
+
+
+def test_cim_writer_package_workers_are_serial_off_linux(tmp_path, monkeypatch, ieee13_writer):
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("worker processes must not be forked off Linux")
+
+    monkeypatch.setattr(cim_write.sys, "platform", "darwin")
+    monkeypatch.setattr(cim_write, "ProcessPoolExecutor", _no_pool)
+
+    ieee13_writer.write(output_path=tmp_path, output_mode="package", max_workers=2)
+    assert (tmp_path / "manifest.xml").exists()
+
+
+def _package_bytes(output_path: Path) -> dict[Path, bytes]:
+    return {
+        path.relative_to(output_path): path.read_bytes() for path in output_path.rglob("*.xml")
+    }
+
+
+def test_cim_writer_concurrent_parallel_writes_keep_their_jobs(tmp_path, ieee13_writer):
+    writers = {"ieee13": ieee13_writer, "p4u": Writer(Reader(_P4U_DT0_DSS).get_system())}
+    for key, writer in writers.items():
+        writer.write(output_path=tmp_path / "serial" / key, output_mode="package")
+
+    with ThreadPoolExecutor(max_workers=len(writers)) as threads:
+        futures = [
+            threads.submit(
+                writer.write,
+                output_path=tmp_path / "parallel" / key,
+                output_mode="package",
+                max_workers=2,
+            )
+            for key, writer in writers.items()
+        ]
+        for future in futures:
+            future.result()
+
+    for key in writers:
+        assert _package_bytes(tmp_path / "parallel" / key) == _package_bytes(
+            tmp_path / "serial" / key
+        )
+
+
+def test_cim_writer_quantity_cache_keeps_signed_zero():
+    writer = Writer(DistributionSystem(name="signed zero"))
+
+    assert math.copysign(1.0, writer._quantity(Voltage(0.0, "kilovolt"), "volt")) == 1.0
+    assert math.copysign(1.0, writer._quantity(Voltage(-0.0, "kilovolt"), "volt")) == -1.0
+
+
+def test_cim_writer_tap_steps_keep_zero_min_tap():
+    system = Reader(_IEEE13_DSS).get_system()
+    winding = SimpleNamespace(total_taps=32, max_tap_pu=1.1, min_tap_pu=0.0, tap_positions=[1.0])
+
+    dv_percent, high_step, low_step, _, normal_step, _ = Writer(system)._tap_step_values(winding)
+
+    assert dv_percent == pytest.approx(1.1 / 32 * 100.0)
+    assert high_step == 3
+    assert low_step == -29
+    assert normal_step == 0
+
+
+def test_cim_writer_invalid_mode(tmp_path, ieee13_writer):
+    writer = ieee13_writer
 
     with pytest.raises(ValueError, match="output_mode"):
         writer.write(output_path=tmp_path, output_mode="invalid")
@@ -76,18 +206,15 @@ def test_cim_writer_serializes_solar_and_fuse_components(tmp_path):
     output_file = tmp_path / "model.xml"
     assert output_file.exists()
 
-    tree = ET.parse(output_file)
-    root = tree.getroot()
-    ns = {"cim": "http://iec.ch/TC57/CIM100#"}
-
-    assert len(root.findall("cim:PhotoVoltaicUnit", ns)) >= 1
-    assert len(root.findall("cim:PowerElectronicsConnection", ns)) >= 1
-    assert len(root.findall("cim:Fuse", ns)) >= 1
+    tag_counts = _top_level_tag_counts(output_file)
+    assert tag_counts[_CIM_NS + "PhotoVoltaicUnit"] >= 1
+    assert tag_counts[_CIM_NS + "PowerElectronicsConnection"] >= 1
+    assert tag_counts[_CIM_NS + "Fuse"] >= 1
 
     writer.write(output_path=tmp_path / "package", output_mode="package")
-    package_names = [path.name for path in (tmp_path / "package").rglob("*.xml")]
-    assert any("distribution_solar" in name for name in package_names)
-    assert any("matrix_impedance_fuse" in name for name in package_names)
+    package_names = _package_name_blob(tmp_path / "package")
+    assert "distribution_solar" in package_names
+    assert "matrix_impedance_fuse" in package_names
 
 
 def test_cim_writer_serializes_battery_components(tmp_path):
@@ -129,13 +256,10 @@ def test_cim_writer_serializes_battery_components(tmp_path):
 
     output_file = tmp_path / "model.xml"
     assert output_file.exists()
-    tree = ET.parse(output_file)
-    root = tree.getroot()
-    ns = {"cim": "http://iec.ch/TC57/CIM100#"}
-
-    assert len(root.findall("cim:BatteryUnit", ns)) >= 1
-    assert len(root.findall("cim:PowerElectronicsConnection", ns)) >= 1
+    tag_counts = _top_level_tag_counts(output_file)
+    assert tag_counts[_CIM_NS + "BatteryUnit"] >= 1
+    assert tag_counts[_CIM_NS + "PowerElectronicsConnection"] >= 1
 
     writer.write(output_path=tmp_path / "package", output_mode="package")
-    package_names = [path.name for path in (tmp_path / "package").rglob("*.xml")]
-    assert any("distribution_battery" in name for name in package_names)
+    package_names = _package_name_blob(tmp_path / "package")
+    assert "distribution_battery" in package_names
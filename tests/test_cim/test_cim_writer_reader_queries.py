@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import pytest
 from rdflib import Graph
 
 from ditto.readers.opendss.reader import Reader as OpenDSSReader
@@ -37,15 +38,24 @@ _BASE = Path(__file__).parents[1]
 _IEEE13_DSS = _BASE / "data" / "opendss_circuit_models" / "ieee13" / "Master.dss"
 
 
-def test_cim_writer_core_reader_query_compatibility(tmp_path):
-    system = OpenDSSReader(_IEEE13_DSS).get_system()
-    writer = CimWriter(system)
+def _count_components(system: DistributionSystem, component_type) -> int:
+    """Count components of a type without materializing them in a list."""
+    return sum(1 for _ in system.get_components(component_type))
 
-    writer.write(output_path=tmp_path, output_mode="single")
-    cim_file = tmp_path / "model.xml"
+
+@pytest.fixture(scope="module")
+def ieee13_cim_graph(tmp_path_factory, ieee13_opendss_system) -> Graph:
+    """Write the shared IEEE 13 system to CIM and parse it once for the read-only query tests."""
+    output_path = tmp_path_factory.mktemp("ieee13_cim")
+    CimWriter(ieee13_opendss_system).write(output_path=output_path, output_mode="single")
 
     graph = Graph()
-    graph.parse(cim_file, format="xml")
+    graph.parse(output_path / "model.xml", format="xml")
+    return graph
+
+
+def test_cim_writer_core_reader_query_compatibility(ieee13_cim_graph):
+    graph = ieee13_cim_graph
 
     buses = query_distribution_buses(graph)
     lines = query_line_segments(graph)
@@ -60,18 +70,16 @@ def test_cim_writer_core_reader_query_compatibility(tmp_path):
     assert not sources.empty
 
 
-def test_cim_writer_transformer_regulator_query_compatibility(tmp_path):
-    source_system = OpenDSSReader(_IEEE13_DSS).get_system()
-    source_regulators = len(list(source_system.get_components(DistributionRegulator)))
-    source_controllers = len(list(source_system.get_components(RegulatorController)))
-    source_capacitors = len(list(source_system.get_components(DistributionCapacitor)))
-    source_switches = len(list(source_system.get_components(MatrixImpedanceSwitch)))
-
-    writer = CimWriter(source_system)
-    writer.write(output_path=tmp_path, output_mode="single")
+def test_cim_writer_transformer_regulator_query_compatibility(
+    ieee13_opendss_system, ieee13_cim_graph
+):
+    source_system = ieee13_opendss_system
+    source_regulators = _count_components(source_system, DistributionRegulator)
+    source_controllers = _count_components(source_system, RegulatorController)
+    source_capacitors = _count_components(source_system, DistributionCapacitor)
+    source_switches = _count_components(source_system, MatrixImpedanceSwitch)
 
-    graph = Graph()
-    graph.parse(tmp_path / "model.xml", format="xml")
+    graph = ieee13_cim_graph
 
     buses = query_distribution_buses(graph)
     loads = query_loads(graph)
@@ -97,6 +105,7 @@ def test_cim_writer_transformer_regulator_query_compatibility(tmp_path):
 
 
 def test_cim_writer_battery_query_compatibility(tmp_path):
+    # Reads its own copy: the shared session system cannot be deep-copied and this test mutates.
     system = OpenDSSReader(_IEEE13_DSS).get_system()
     bus = next(iter(system.get_components(DistributionBus)))
 
@@ -1,7 +1,14 @@
 """Module for testing parsers."""
 
 from pathlib import Path
+import math
 import pytest
+from gdm.distribution import DistributionSystem
+from gdm.distribution.components import DistributionBus, DistributionLoad
+from gdm.distribution.enums import VoltageTypes
+from ditto.readers.cyme.equipment.phase_voltagesource_equipment import (
+    PhaseVoltageSourceEquipmentMapper,
+)
 from ditto.readers.cyme.reader import Reader
 from ditto.writers.opendss.write import Writer
 import sys
@@ -49,3 +56,26 @@ def test_cyme_reader(cyme_folder: Path, tmp_path):
     system.to_geojson(export_path / (cyme_folder.stem.lower() + ".geojson"))
 
     assert json_path.exists(), "Failed to export the json file"
+
+
+def test_add_components_if_missing_skips_auto_attached():
+    reader = Reader.__new__(Reader)
+    reader.system = DistributionSystem(auto_add_composed_components=True)
+    load = DistributionLoad.example()
+
+    # Adding the load auto-attaches its bus, which must then be skipped.
+    reader._add_components_if_missing([load, load.bus])
+
+    assert reader.system.has_component(load)
+    assert reader.system.has_component(load.bus)
+
+
+def test_phase_source_voltage_uses_exact_sqrt3():
+    bus = DistributionBus.example()
+    mapper = PhaseVoltageSourceEquipmentMapper(DistributionSystem(name="cyme"))
+
+    sources = mapper.parse(bus, 12.47, VoltageTypes.LINE_TO_LINE)
+
+    assert len(sources) == 3
+    for source in sources:
+        assert source.voltage.m_as("kilovolt") == pytest.approx(12.47 / math.sqrt(3), rel=1e-12)
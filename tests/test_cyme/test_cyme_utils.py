@@ -0,0 +1,47 @@
+import locale
+
+from ditto.readers.cyme.constants import ModelUnitSystem
+from ditto.readers.cyme.reader import Reader
+from ditto.readers.cyme.utils import read_cyme_data, section_offsets
+
+
+def test_section_offsets(tmp_path):
+    cyme_file = tmp_path / "Network.txt"
+    cyme_file.write_text(
+        "[GENERAL]\n"
+        "DATE=today\n"
+        "\n"
+        "[SI]\n"
+        "\n"
+        "[NODE]\n"
+        "FORMAT_NODE=NodeID,CoordX\n"
+        "n1,1.0\n"
+        "n2,2.0\n"
+    )
+
+    offsets = section_offsets(cyme_file)
+    assert set(offsets) == {"GENERAL", "SI", "NODE"}
+    assert offsets["SI"][0] == offsets["SI"][1]
+
+    data = read_cyme_data(cyme_file, "NODE", index_col="NodeID")
+    assert list(data.columns) == ["NodeID", "CoordX"]
+    assert list(data.index) == ["n1", "n2"]
+
+    assert read_cyme_data(cyme_file, "SECTION").empty
+
+
+def test_read_cyme_data_uses_locale_encoding(tmp_path, monkeypatch):
+    monkeypatch.setattr(locale, "getpreferredencoding", lambda do_setlocale=True: "cp1252")
+    cyme_file = tmp_path / "Network.txt"
+    cyme_file.write_bytes("[NODE]\nFORMAT_NODE=NodeID,Name\nn1,Café\n".encode("cp1252"))
+
+    data = read_cyme_data(cyme_file, "NODE", index_col="NodeID")
+    assert data.loc["n1", "Name"] == "Café"
+
+
+def test_unit_system_detected_anywhere_in_line(tmp_path):
+    cyme_file = tmp_path / "Network.txt"
+    cyme_file.write_text("[GENERAL]\nUNITS=[SI]\n")
+
+    reader = Reader.__new__(Reader)
+    assert reader._get_unit_system(cyme_file) == ModelUnitSystem.SI
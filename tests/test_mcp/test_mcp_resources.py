@@ -1,6 +1,7 @@
 """Tests for the DiTTo MCP server documentation resources."""
 
 import json
+from functools import lru_cache
 
 import pytest
 
@@ -12,14 +13,23 @@ from ditto.mcp.docs import get_docs_dir, list_doc_pages, read_doc_page
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _read_page(slug: str) -> str:
+    return read_doc_page(slug)
+
+
 class TestDocsDiscovery:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def pages(cls):
+        return list_doc_pages()
+
     def test_docs_dir_exists(self):
         docs_dir = get_docs_dir()
         assert docs_dir.exists(), f"docs dir not found at {docs_dir}"
         assert docs_dir.is_dir()
 
-    def test_list_doc_pages_returns_pages(self):
-        pages = list_doc_pages()
+    def test_list_doc_pages_returns_pages(self, pages):
         assert isinstance(pages, list)
         assert len(pages) > 0
         # Each page should have slug, title, uri
@@ -29,37 +39,36 @@ class TestDocsDiscovery:
             assert "uri" in page
             assert page["uri"].startswith("ditto://docs/")
 
-    def test_list_doc_pages_includes_expected(self):
-        pages = list_doc_pages()
+    def test_list_doc_pages_includes_expected(self, pages):
         slugs = [p["slug"] for p in pages]
         assert "index" in slugs
         assert "usage" in slugs
         assert "install" in slugs
 
     def test_read_doc_page_index(self):
-        content = read_doc_page("index")
+        content = _read_page("index")
         assert isinstance(content, str)
         assert len(content) > 0
         assert "DiTTo" in content
 
     def test_read_doc_page_usage(self):
-        content = read_doc_page("usage")
+        content = _read_page("usage")
         assert "Usage" in content or "usage" in content.lower()
 
     def test_read_doc_page_install(self):
-        content = read_doc_page("install")
+        content = _read_page("install")
         assert "install" in content.lower() or "pip" in content.lower()
 
     def test_read_doc_page_api_opendss_reader(self):
-        content = read_doc_page("api/opendss_reader")
+        content = _read_page("api/opendss_reader")
         assert "OpenDSS" in content
 
     def test_read_doc_page_api_cim_reader(self):
-        content = read_doc_page("api/cim_reader")
+        content = _read_page("api/cim_reader")
         assert "CIM" in content
 
     def test_read_doc_page_api_opendss_writer(self):
-        content = read_doc_page("api/opendss_writer")
+        content = _read_page("api/opendss_writer")
         assert "Writer" in content or "writer" in content.lower()
 
     def test_read_doc_page_unknown_slug(self):
@@ -67,7 +76,7 @@ class TestDocsDiscovery:
             read_doc_page("nonexistent_page")
 
     def test_read_doc_page_reference(self):
-        content = read_doc_page("reference")
+        content = _read_page("reference")
         assert "API" in content or "Reference" in content
 
 
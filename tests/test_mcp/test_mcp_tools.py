@@ -56,14 +56,32 @@ def test_list_writers():
 class TestOpenDSSModel:
     """Tests that load the IEEE 13-node OpenDSS model."""
 
-    @pytest.fixture(autouse=True)
-    def _setup(self):
-        """Load the model once and clean up after."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ieee13_system(cls):
+        """Read the model once for the whole class."""
         _SYNC_STATE.systems.clear()
         read_opendss_model(str(_IEEE13_DSS), name="ieee13")
+        yield _SYNC_STATE.systems["ieee13"]
+        _SYNC_STATE.systems.clear()
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, ieee13_system):
+        """Register the shared model and clean up after."""
+        _SYNC_STATE.systems.clear()
+        _SYNC_STATE.store("ieee13", ieee13_system)
         yield
         _SYNC_STATE.systems.clear()
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ieee13_gdm_json(cls, tmp_path_factory, ieee13_system):
+        """Export the shared model to GDM JSON once for the whole class."""
+        json_path = tmp_path_factory.mktemp("gdm_json") / "model.json"
+        _SYNC_STATE.store("ieee13", ieee13_system)
+        export_gdm_json(name="ieee13", output_path=str(json_path))
+        return json_path
+
     def test_read_opendss_model(self):
         assert "ieee13" in _SYNC_STATE.systems
 
@@ -111,12 +129,9 @@ class TestOpenDSSModel:
         assert result["output_path"] == str(json_path.resolve())
         assert json_path.exists()
 
-    def test_load_gdm_json_roundtrip(self, tmp_path):
-        json_path = tmp_path / "model.json"
-        export_gdm_json(name="ieee13", output_path=str(json_path))
-
+    def test_load_gdm_json_roundtrip(self, ieee13_gdm_json):
         _SYNC_STATE.systems.pop("reloaded", None)
-        result = load_gdm_json(str(json_path), name="reloaded")
+        result = load_gdm_json(str(ieee13_gdm_json), name="reloaded")
         assert result["name"] == "reloaded"
         assert result["total_components"] > 0
 
@@ -129,11 +144,20 @@ class TestOpenDSSModel:
 class TestCIMModel:
     """Tests that load the IEEE 13-node CIM model."""
 
-    @pytest.fixture(autouse=True)
-    def _setup(self):
-        """Load the model once and clean up after."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def cim13_system(cls):
+        """Read the model once for the whole class."""
         _SYNC_STATE.systems.clear()
         read_cim_model(str(_CIM_XML), name="cim13")
+        yield _SYNC_STATE.systems["cim13"]
+        _SYNC_STATE.systems.clear()
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, cim13_system):
+        """Register the shared model and clean up after."""
+        _SYNC_STATE.systems.clear()
+        _SYNC_STATE.store("cim13", cim13_system)
         yield
         _SYNC_STATE.systems.clear()
 
@@ -10,7 +10,17 @@ from ditto.readers.opendss.reader import Reader
 base_path = Path(__file__).parents[1]
 opendss_circuit_models = base_path / "data" / "opendss_circuit_models"
 assert opendss_circuit_models.exists(), f"{opendss_circuit_models} does not exist"
-OPENDSS_CASEFILES = list(opendss_circuit_models.rglob("Master.dss"))
+# Feeders large enough that reading and serializing them takes several seconds each.
+SLOW_MODELS = {"SFO", "ckt7", "ckt24"}
+OPENDSS_CASEFILES = [
+    pytest.param(
+        path,
+        marks=pytest.mark.slow
+        if path.relative_to(opendss_circuit_models).parts[0] in SLOW_MODELS
+        else (),
+    )
+    for path in opendss_circuit_models.rglob("Master.dss")
+]
 
 
 @pytest.mark.parametrize("opendss_file", OPENDSS_CASEFILES)
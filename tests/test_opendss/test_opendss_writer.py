@@ -1,6 +1,7 @@
 """Module for testing writers."""
 
 from pathlib import Path
+import math
 
 from gdm.distribution import DistributionSystem
 from gdm.distribution.components import (
@@ -13,8 +14,11 @@ from gdm.distribution.components import (
     DistributionBus,
     GeometryBranch,
 )
+from gdm.distribution.enums import VoltageTypes
+from gdm.quantities import Voltage
 import pytest
 
+from ditto.writers.opendss.components.distribution_load import DistributionLoadMapper
 from ditto.writers.opendss.write import Writer
 
 MODULES = [
@@ -30,14 +34,15 @@ MODULES = [
 ]
 
 
-@pytest.mark.parametrize("component", MODULES)
-def test_component(component, tmp_path):
+@pytest.mark.parametrize("separate", [False, True], ids=["combined", "separate"])
+@pytest.mark.parametrize("component", MODULES, ids=lambda component: component.__name__)
+def test_component(component, separate, tmp_path):
     system = DistributionSystem(
         name=f"test {component.__name__}", auto_add_composed_components=True
     )
     system.add_component(component.example())
     writer = Writer(system)
-    writer.write(output_path=tmp_path, separate_substations=False, separate_feeders=False)
+    writer.write(output_path=tmp_path, separate_substations=separate, separate_feeders=separate)
 
     # Verify at least one .dss file was written with content
     dss_files = list(Path(tmp_path).rglob("*.dss"))
@@ -48,8 +53,7 @@ def test_component(component, tmp_path):
 
 def test_all_types(tmp_path):
     system = DistributionSystem(name="test full system", auto_add_composed_components=True)
-    for component in MODULES:
-        system.add_component(component.example())
+    system.add_components(*(component.example() for component in MODULES))
     writer = Writer(system)
     writer.write(output_path=tmp_path, separate_substations=True, separate_feeders=True)
 
@@ -61,3 +65,15 @@ def test_all_types(tmp_path):
 def test_normalize_length_unit_enum_tokens():
     text = "new LineGeometry.g1 Units=LengthUnit.m Cond=1"
     assert Writer._normalize_dss_string(text) == "new LineGeometry.g1 Units=m Cond=1"
+
+
+def test_three_phase_load_kv_uses_exact_sqrt3():
+    load = DistributionLoad.example()
+    load.bus.rated_voltage = Voltage(7.2, "kilovolt")
+    load.bus.voltage_type = VoltageTypes.LINE_TO_GROUND
+
+    mapper = DistributionLoadMapper(load, DistributionSystem(name="kv"))
+    mapper.map_bus()
+
+    # 12.4708 kV with sqrt(3); the old 1.732 factor gave 12.4704 kV.
+    assert mapper.opendss_dict["kV"] == pytest.approx(7.2 * math.sqrt(3), rel=1e-12)
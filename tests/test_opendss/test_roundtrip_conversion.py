@@ -17,7 +17,14 @@ TEST_MODELS = [
     / "opendss_circuit_models"
     / "ieee13"
     / OpenDSSFileTypes.MASTER_FILE.value,
-    test_folder / "data" / "opendss_circuit_models" / "P4U" / OpenDSSFileTypes.MASTER_FILE.value,
+    pytest.param(
+        test_folder
+        / "data"
+        / "opendss_circuit_models"
+        / "P4U"
+        / OpenDSSFileTypes.MASTER_FILE.value,
+        marks=pytest.mark.slow,
+    ),
 ]
 
 